@@ -4,56 +4,77 @@ import time
 import logging
 import sys
 import os
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-sys.path.insert(0, os.path.dirname(__file__))
+_MODULE_DIR = os.path.dirname(__file__)
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
 
 from app.services.real_apis_service import unified_apis_service
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Cycle period: 6 hours, doubling after each empty cycle up to a day
+BASE_INTERVAL = 6 * 3600
+MAX_INTERVAL = 24 * 3600
+
 class SimpleDiscovery:
     def __init__(self):
         self.stats = {"runs": 0, "tools_found": 0}
     
     def run_discovery(self):
         logger.info("🧠 Discovery starting...")
-        total_new = 0
+        started = time.monotonic()
+        found = {}
+        
+        sources = {
+            "GitHub": (unified_apis_service.run_sync_discover_github, 20),
+            "NPM": (unified_apis_service.run_sync_discover_npm, 15),
+            "PyPI": (unified_apis_service.run_sync_discover_pypi, 10),
+        }
         
-        try:
-            # GitHub discovery
-            result = unified_apis_service.run_sync_discover_github(target_tools=20)
-            new_tools = result.get("total_saved", 0)
-            total_new += new_tools
-            logger.info(f"GitHub: {new_tools} tools")
-            
-            # NPM discovery
-            result = unified_apis_service.run_sync_discover_npm(target_tools=15)
-            new_tools = result.get("total_saved", 0)
-            total_new += new_tools
-            logger.info(f"NPM: {new_tools} tools")
-            
-            # PyPI discovery
-            result = unified_apis_service.run_sync_discover_pypi(target_tools=10)
-            new_tools = result.get("total_saved", 0)
-            total_new += new_tools
-            logger.info(f"PyPI: {new_tools} tools")
-            
-        except Exception as e:
-            logger.error(f"Error: {e}")
+        # Each source is I/O-bound, so run them side by side
+        with ThreadPoolExecutor(max_workers=len(sources)) as executor:
+            futures = {
+                executor.submit(discover, target_tools=target): name
+                for name, (discover, target) in sources.items()
+            }
+            for future in as_completed(futures):
+                name = futures[future]
+                try:
+                    found[name] = future.result().get("total_saved", 0)
+                except Exception as e:
+                    logger.error("%s error: %s", name, e)
         
+        total_new = sum(found.values())
         self.stats["runs"] += 1
         self.stats["tools_found"] += total_new
-        logger.info(f"✅ Discovery complete: {total_new} new tools found")
+        
+        # One summary line per cycle, with the per-source counts attached as fields
+        logger.info(
+            "✅ Discovery complete: %d new tools found in %.1fs (%s)",
+            total_new, time.monotonic() - started,
+            ", ".join(f"{name}: {count}" for name, count in found.items()) or "no sources succeeded",
+            extra={"discovery_found": found, "discovery_total_new": total_new},
+        )
         return {"new_tools": total_new}
     
     def start_continuous(self):
-        logger.info("🚀 Starting continuous discovery (every 6 hours)...")
+        logger.info("🚀 Starting continuous discovery (every 6 hours, backing off when idle)...")
+        consecutive_empty = 0
         while True:
             try:
-                self.run_discovery()
-                logger.info("⏳ Waiting 6 hours until next cycle...")
-                time.sleep(6 * 3600)
+                started = time.monotonic()
+                result = self.run_discovery()
+                
+                # Back off while cycles find nothing, reset as soon as one does
+                consecutive_empty = consecutive_empty + 1 if result["new_tools"] == 0 else 0
+                period = min(MAX_INTERVAL, BASE_INTERVAL * (2 ** min(consecutive_empty, 2)))
+                wait = max(0.0, period - (time.monotonic() - started))
+                
+                logger.info(f"⏳ Waiting {wait / 3600:.1f} hours until next cycle...")
+                time.sleep(wait)
             except KeyboardInterrupt:
                 logger.info("⚠️ Stopped by user")
                 break
@@ -0,0 +1,31 @@
+"""Add partial index for the dead-site cohort
+
+Revision ID: dead_sites_index_001
+Revises: scoring_order_index_001
+Create Date: 2026-10-17 17:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'dead_sites_index_001'
+down_revision = 'scoring_order_index_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Tools whose site was unreachable or erroring (show-dead / reset-dead)
+        op.create_index(
+            'idx_tool_dead_sites', 'discovered_tools', ['last_activity_check'], unique=False,
+            postgresql_where=sa.text("activity_score = 0.0 AND (website_status = 0 OR website_status >= 400)"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_tool_dead_sites', table_name='discovered_tools', postgresql_concurrently=True)
@@ -0,0 +1,38 @@
+"""Add partial indexes for activity scoring queries
+
+Revision ID: scoring_indexes_001
+Revises: 60d4d51d83f8
+Create Date: 2026-10-17 12:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'scoring_indexes_001'
+down_revision = '60d4d51d83f8'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Scored tools whose score has gone stale
+        op.create_index(
+            'idx_tool_stale_score', 'discovered_tools', ['last_activity_check'], unique=False,
+            postgresql_where=sa.text("activity_score IS NOT NULL AND website IS NOT NULL AND website <> ''"),
+            postgresql_concurrently=True
+        )
+        # Tools that were never scored
+        op.create_index(
+            'idx_tool_unscored', 'discovered_tools', ['created_at'], unique=False,
+            postgresql_where=sa.text("activity_score IS NULL AND website IS NOT NULL AND website <> ''"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_tool_unscored', table_name='discovered_tools', postgresql_concurrently=True)
+        op.drop_index('idx_tool_stale_score', table_name='discovered_tools', postgresql_concurrently=True)
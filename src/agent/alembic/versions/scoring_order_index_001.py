@@ -0,0 +1,32 @@
+"""Add partial index matching the full-scan scoring order
+
+Revision ID: scoring_order_index_001
+Revises: site_health_001
+Create Date: 2026-10-17 16:30:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'scoring_order_index_001'
+down_revision = 'site_health_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    # CONCURRENTLY cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        # Same ordering as the full-scan ORDER BY (website_status DESC NULLS LAST, created_at DESC)
+        op.create_index(
+            'idx_tool_needs_scoring', 'discovered_tools',
+            [sa.text('website_status DESC NULLS LAST'), sa.text('created_at DESC')], unique=False,
+            postgresql_where=sa.text("website IS NOT NULL AND website <> ''"),
+            postgresql_concurrently=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('idx_tool_needs_scoring', table_name='discovered_tools', postgresql_concurrently=True)
@@ -0,0 +1,25 @@
+"""Add dead-site retry backoff columns
+
+Revision ID: site_health_001
+Revises: scoring_indexes_001
+Create Date: 2026-10-17 16:00:00.000000
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision = 'site_health_001'
+down_revision = 'scoring_indexes_001'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    op.add_column('discovered_tools', sa.Column('consecutive_failures', sa.Integer(), server_default='0', nullable=False))
+    op.add_column('discovered_tools', sa.Column('cooldown_until', sa.DateTime(timezone=True), nullable=True))
+
+
+def downgrade() -> None:
+    op.drop_column('discovered_tools', 'cooldown_until')
+    op.drop_column('discovered_tools', 'consecutive_failures')
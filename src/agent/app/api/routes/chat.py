@@ -1,7 +1,7 @@
 # Fixed API routes - simplified to work with unified activity service
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session
-from sqlalchemy import func, and_, or_, desc
+from sqlalchemy import func, and_, or_, desc, case
 from typing import Optional, List
 from datetime import datetime, timedelta
 
@@ -15,6 +15,19 @@ from app.services.unified_activity_service import unified_activity_service
 # Create a router for the chat API
 router = APIRouter()
 
+# Columns returned by /ai-tools/high-activity
+_HIGH_ACTIVITY_COLUMNS = (
+    DiscoveredTool.name,
+    DiscoveredTool.website,
+    DiscoveredTool.description,
+    DiscoveredTool.tool_type_detected,
+    DiscoveredTool.activity_score,
+    DiscoveredTool.github_stars,
+    DiscoveredTool.npm_weekly_downloads,
+    DiscoveredTool.is_actively_maintained,
+    DiscoveredTool.last_activity_check,
+)
+
 # ================================================================
 # EXISTING CHAT ENDPOINTS (Keep unchanged)
 # ================================================================
@@ -82,7 +95,8 @@ def get_high_activity_tools(
 ):
     """Get only tools with high activity scores (>0.7 by default)"""
     
-    query = db.query(DiscoveredTool).filter(
+    # Project only the response columns; the wide text fields stay in the DB
+    query = db.query(*_HIGH_ACTIVITY_COLUMNS).filter(
         DiscoveredTool.activity_score >= activity_threshold
     )
     
@@ -92,20 +106,7 @@ def get_high_activity_tools(
     tools = query.order_by(desc(DiscoveredTool.activity_score)).limit(limit).all()
     
     return {
-        "tools": [
-            {
-                "name": tool.name,
-                "website": tool.website,
-                "description": tool.description,
-                "tool_type_detected": tool.tool_type_detected,
-                "activity_score": tool.activity_score,
-                "github_stars": tool.github_stars,
-                "npm_weekly_downloads": tool.npm_weekly_downloads,
-                "is_actively_maintained": tool.is_actively_maintained,
-                "last_activity_check": tool.last_activity_check
-            }
-            for tool in tools
-        ],
+        "tools": [tool._asdict() for tool in tools],
         "count": len(tools),
         "activity_threshold": activity_threshold,
         "note": "High-activity tools using unified assessment system"
@@ -141,27 +142,15 @@ def get_activity_status(
 ):
     """Get activity status overview"""
     
-    # Tools by activity level
-    total_tools = db.query(func.count(DiscoveredTool.id)).scalar()
-    
-    highly_active = db.query(func.count(DiscoveredTool.id)).filter(
-        DiscoveredTool.activity_score >= 0.8
-    ).scalar()
-    
-    moderately_active = db.query(func.count(DiscoveredTool.id)).filter(
-        and_(
-            DiscoveredTool.activity_score >= 0.5,
-            DiscoveredTool.activity_score < 0.8
-        )
-    ).scalar()
-    
-    low_activity = db.query(func.count(DiscoveredTool.id)).filter(
-        DiscoveredTool.activity_score < 0.5
-    ).scalar()
-    
-    never_assessed = db.query(func.count(DiscoveredTool.id)).filter(
-        DiscoveredTool.last_activity_check.is_(None)
-    ).scalar()
+    # Tools by activity level, counted in a single pass over the table
+    score = DiscoveredTool.activity_score
+    total_tools, highly_active, moderately_active, low_activity, never_assessed = db.query(
+        func.count(DiscoveredTool.id),
+        func.coalesce(func.sum(case((score >= 0.8, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((and_(score >= 0.5, score < 0.8), 1), else_=0)), 0),
+        func.coalesce(func.sum(case((score < 0.5, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((DiscoveredTool.last_activity_check.is_(None), 1), else_=0)), 0),
+    ).one()
     
     # Activity by tool type
     activity_by_type = db.query(
@@ -234,8 +223,13 @@ def get_tools_statistics(
 ):
     """Get basic statistics about discovered tools"""
     
-    # Basic counts
-    total_count = db.query(func.count(DiscoveredTool.id)).scalar()
+    # Basic counts and activity metrics in a single pass over the table
+    total_count, high_activity, activity_checked, actively_maintained = db.query(
+        func.count(DiscoveredTool.id),
+        func.coalesce(func.sum(case((DiscoveredTool.activity_score >= 0.7, 1), else_=0)), 0),
+        func.coalesce(func.sum(case((DiscoveredTool.last_activity_check.isnot(None), 1), else_=0)), 0),
+        func.coalesce(func.sum(case((DiscoveredTool.is_actively_maintained == True, 1), else_=0)), 0),
+    ).one()
     
     # Count by detected tool type
     type_stats = db.query(
@@ -245,19 +239,6 @@ def get_tools_statistics(
         DiscoveredTool.tool_type_detected.isnot(None)
     ).group_by(DiscoveredTool.tool_type_detected).all()
     
-    # Activity metrics
-    high_activity = db.query(func.count(DiscoveredTool.id)).filter(
-        DiscoveredTool.activity_score >= 0.7
-    ).scalar()
-    
-    activity_checked = db.query(func.count(DiscoveredTool.id)).filter(
-        DiscoveredTool.last_activity_check.isnot(None)
-    ).scalar()
-    
-    actively_maintained = db.query(func.count(DiscoveredTool.id)).filter(
-        DiscoveredTool.is_actively_maintained == True
-    ).scalar()
-    
     return {
         "total_tools": total_count,
         "by_detected_type": {stat.tool_type_detected: stat.count for stat in type_stats},
@@ -1,13 +1,32 @@
+import threading
+
 from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker, declarative_base
 
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+# Explicit pool for server databases: reuse connections across the discovery/scoring
+# sessions, drop dead ones (pre-ping) and recycle before server-side idle timeouts
+_POOL_OPTIONS = {
+    "pool_size": 10,
+    "max_overflow": 20,
+    "pool_pre_ping": True,
+    "pool_recycle": 1800,
+}
+
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    **({} if settings.SQLALCHEMY_DATABASE_URI.startswith("sqlite") else _POOL_OPTIONS)
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
 Base = declarative_base()
 
+# discovered_tools.website has no unique constraint: discovery savers hold this lock
+# around their "known website?" check and the INSERT/commit, so concurrent sources
+# in one process cannot both insert the same URL
+discovered_tools_write_lock = threading.Lock()
+
 # Dependency to get DB session
 def get_db():
     db = SessionLocal()
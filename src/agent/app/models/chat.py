@@ -1,4 +1,4 @@
-from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Boolean
+from sqlalchemy import Column, Integer, String, Text, DateTime, ForeignKey, Float, Boolean, Index, text
 from sqlalchemy.orm import relationship
 from sqlalchemy.sql import func
 
@@ -82,11 +82,38 @@ class DiscoveredTool(Base):
     usage_popularity_score = Column(Float)
     maintenance_quality_score = Column(Float)
     
+    # Dead-site retry backoff: the cooldown doubles with each consecutive failed probe
+    consecutive_failures = Column(Integer, default=0, server_default="0", nullable=False)
+    cooldown_until = Column(DateTime(timezone=True))
+    
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
     
     # Relationships
     reports = relationship("ToolReport", back_populates="tool")
+    
+    # Partial indexes for the activity scoring queries
+    __table_args__ = (
+        Index(
+            'idx_tool_stale_score', 'last_activity_check',
+            postgresql_where=text("activity_score IS NOT NULL AND website IS NOT NULL AND website <> ''")
+        ),
+        Index(
+            'idx_tool_unscored', 'created_at',
+            postgresql_where=text("activity_score IS NULL AND website IS NOT NULL AND website <> ''")
+        ),
+        # Matches the full-scan ORDER BY so it is read in index order instead of sorted
+        # (PostgreSQL only - SQLite rejects NULLS LAST in index definitions)
+        Index(
+            'idx_tool_needs_scoring', website_status.desc().nulls_last(), created_at.desc(),
+            postgresql_where=text("website IS NOT NULL AND website <> ''")
+        ).ddl_if(dialect='postgresql'),
+        # Dead-site report / reset: only the (small) dead cohort, ordered by last check
+        Index(
+            'idx_tool_dead_sites', 'last_activity_check',
+            postgresql_where=text("activity_score = 0.0 AND (website_status = 0 OR website_status >= 400)")
+        ),
+    )
 
 class SourceTracking(Base):
     """Track which sources we monitor for tool discovery"""
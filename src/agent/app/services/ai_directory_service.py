@@ -4,6 +4,8 @@
 # Follows the same pattern as real_apis_service.py
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 from bs4 import BeautifulSoup
 import time
 import logging
@@ -16,7 +18,7 @@ from dataclasses import dataclass
 
 # Database imports
 try:
-    from app.db.database import SessionLocal
+    from app.db.database import SessionLocal, discovered_tools_write_lock
     from app.models.chat import DiscoveredTool
     from sqlalchemy import and_, or_
     DATABASE_AVAILABLE = True
@@ -63,6 +65,14 @@ class AIDirectoryService:
             'Connection': 'keep-alive',
             'Upgrade-Insecure-Requests': '1',
         })
+        # Keep-alive pool with the same transient 429/5xx retry policy as real_apis_service
+        adapter = HTTPAdapter(
+            pool_connections=10,
+            pool_maxsize=10,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Rate limiting
         self.request_delay = 2  # seconds between requests
@@ -225,6 +235,11 @@ class AIDirectoryService:
             logger.error("❌ Database not available")
             return {"saved": 0, "duplicates": 0, "errors": 0}
         
+        with discovered_tools_write_lock:
+            return self._save_tools_locked(tools)
+    
+    def _save_tools_locked(self, tools: List[AITool]) -> Dict[str, int]:
+        """Body of _save_tools_to_database; the caller holds discovered_tools_write_lock"""
         db = SessionLocal()
         saved_count = 0
         duplicate_count = 0
@@ -5,6 +5,8 @@
 import asyncio
 import aiohttp
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import time
 import logging
 import re
@@ -18,7 +20,7 @@ from dataclasses import dataclass
 
 # Database imports
 try:
-    from app.db.database import SessionLocal
+    from app.db.database import SessionLocal, discovered_tools_write_lock
     from app.models.chat import DiscoveredTool
     from sqlalchemy import and_, or_
     DATABASE_AVAILABLE = True
@@ -62,6 +64,15 @@ class UnifiedRealAPIsService:
             'Accept-Language': 'en-US,en;q=0.5',
             'Connection': 'keep-alive'
         })
+        # Keep-alive pool sized for the concurrent discovery sources; transient
+        # 429/5xx responses are retried with backoff before giving up
+        adapter = HTTPAdapter(
+            pool_connections=20,
+            pool_maxsize=20,
+            max_retries=Retry(total=3, backoff_factor=0.3, status_forcelist=(429, 500, 502, 503, 504)),
+        )
+        self.session.mount('https://', adapter)
+        self.session.mount('http://', adapter)
         
         # Rate limiting
         self.request_delay = 1.0  # Base delay between requests
@@ -178,34 +189,47 @@ class UnifiedRealAPIsService:
             source_data=json.dumps(api_tool.metadata) if api_tool.metadata else None
         )
     
-    def _save_tools_to_database(self, tools: List[APITool]) -> Dict[str, int]:
-        """Save discovered tools to database"""
+    def _save_tools_to_database(self, tools: List[APITool]) -> Dict[str, Any]:
+        """Save discovered tools to database (saved_ids lists the new rows' primary keys)"""
         
         if not DATABASE_AVAILABLE:
             logger.error("❌ Database not available")
-            return {"saved": 0, "duplicates": 0, "errors": 0}
+            return {"saved": 0, "duplicates": 0, "errors": 0, "saved_ids": []}
         
+        with discovered_tools_write_lock:
+            return self._save_tools_locked(tools)
+    
+    def _save_tools_locked(self, tools: List[APITool]) -> Dict[str, Any]:
+        """Body of _save_tools_to_database; the caller holds discovered_tools_write_lock"""
         db = SessionLocal()
+        saved_tools = []
         saved_count = 0
         duplicate_count = 0
         error_count = 0
         
         try:
+            # Look up every known website in one query instead of one per tool
+            websites = {tool.website for tool in tools if tool.website}
+            known_websites = {
+                website for (website,) in db.query(DiscoveredTool.website).filter(
+                    DiscoveredTool.website.in_(websites)
+                )
+            } if websites else set()
+            
             for tool in tools:
                 try:
                     # Check if tool already exists (by website URL)
-                    existing = db.query(DiscoveredTool).filter(
-                        DiscoveredTool.website == tool.website
-                    ).first()
-                    
-                    if existing:
+                    if tool.website in known_websites:
                         duplicate_count += 1
                         logger.debug(f"  🔄 Duplicate: {tool.name}")
                         continue
                     
-                    # Convert and save new tool
+                    # Convert and save new tool; the flush below batches the INSERTs
                     db_tool = self._convert_to_discovered_tool(tool)
                     db.add(db_tool)
+                    if tool.website:
+                        known_websites.add(tool.website)
+                    saved_tools.append(db_tool)
                     saved_count += 1
                     
                     logger.debug(f"  💾 Saved: {tool.name}")
@@ -215,19 +239,22 @@ class UnifiedRealAPIsService:
                     logger.error(f"  ❌ Error saving {tool.name}: {str(e)}")
                     continue
             
-            # Commit all changes
+            # Commit all changes (ids are assigned by the flush)
+            db.flush()
+            saved_ids = [db_tool.id for db_tool in saved_tools]
             db.commit()
             
             return {
                 "saved": saved_count,
                 "duplicates": duplicate_count,
-                "errors": error_count
+                "errors": error_count,
+                "saved_ids": saved_ids
             }
             
         except Exception as e:
             db.rollback()
             logger.error(f"  ❌ Database transaction failed: {str(e)}")
-            return {"saved": 0, "duplicates": 0, "errors": len(tools)}
+            return {"saved": 0, "duplicates": 0, "errors": len(tools), "saved_ids": []}
         
         finally:
             db.close()
@@ -1052,7 +1079,7 @@ class UnifiedRealAPIsService:
                     }
                     
                     logger.info(f"✅ {api_name}: {len(tools)} tools ({api_time:.1f}s) {'[INCREMENTAL]' if since_param else '[FULL]'}")
-                    time.sleep(1)
+                    # No pause between APIs - each _discover_* paces its own host via _rate_limit
                     
                 except Exception as e:
                     api_results[api_name] = {
@@ -1065,7 +1092,7 @@ class UnifiedRealAPIsService:
             
             # Process results
             unique_tools = self._deduplicate_tools(all_tools)
-            db_result = self._save_tools_to_database(unique_tools) if unique_tools else {"saved": 0, "duplicates": 0, "errors": 0}
+            db_result = self._save_tools_to_database(unique_tools) if unique_tools else {"saved": 0, "duplicates": 0, "errors": 0, "saved_ids": []}
             
             processing_time = time.time() - start_time
             
@@ -1076,6 +1103,7 @@ class UnifiedRealAPIsService:
                 "success": True,
                 "total_discovered": len(all_tools),
                 "total_saved": db_result["saved"],
+                "new_tool_ids": db_result["saved_ids"],
                 "total_skipped": total_skipped,
                 "processing_time": processing_time,
                 "api_results": api_results,
@@ -1196,6 +1224,7 @@ class UnifiedRealAPIsService:
                 "success": True,
                 "total_discovered": len(tools),
                 "total_saved": db_result["saved"],
+                "new_tool_ids": db_result["saved_ids"],
                 "total_skipped": 0,
                 "incremental_skip": False,
                 "processing_time": processing_time,
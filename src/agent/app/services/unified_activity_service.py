@@ -6,15 +6,27 @@ import json
 import hashlib
 import os
 import math
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
 from datetime import datetime, timedelta, timezone
 from typing import Dict, List, Any, Optional, Tuple
 from urllib.parse import urlparse
 from sqlalchemy.orm import Session
 from sqlalchemy import and_, or_
 
+# Optional fast JSON decoder for GitHub/NPM/PyPI API responses
+try:
+    import orjson
+    _json_loads = orjson.loads  # aiohttp hands the decoded text to this
+except ImportError:
+    _json_loads = json.loads
+
 from app.db.database import SessionLocal
 from app.models.chat import DiscoveredTool
 
+# Session shared by every probe of an in-flight batch (None outside batch_session())
+_batch_session: ContextVar[Optional[aiohttp.ClientSession]] = ContextVar('_batch_session', default=None)
+
 class UnifiedActivityAssessment:
     """
     Unified tool assessment system that replaces separate health checkers
@@ -39,6 +51,27 @@ class UnifiedActivityAssessment:
             'huggingface_model': r'huggingface\.co/[\w\-\.]+/[\w\-\.]+'
         }
     
+    @asynccontextmanager
+    async def _client_session(self):
+        """Reuse the batch-wide session when one is open, otherwise open a per-call session"""
+        session = _batch_session.get()
+        if session is not None:
+            yield session
+            return
+        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            yield session
+    
+    @asynccontextmanager
+    async def batch_session(self, limit: int = 64, limit_per_host: int = 8):
+        """One pooled session (shared TLS/DNS) for every assessment started inside this block"""
+        connector = aiohttp.TCPConnector(limit=limit, limit_per_host=limit_per_host, ttl_dns_cache=300)
+        async with aiohttp.ClientSession(timeout=self.timeout, connector=connector) as session:
+            token = _batch_session.set(session)
+            try:
+                yield session
+            finally:
+                _batch_session.reset(token)
+    
     def detect_tool_type(self, tool: DiscoveredTool) -> str:
         """Automatically detect tool type based on URL and description"""
         
@@ -115,7 +148,7 @@ class UnifiedActivityAssessment:
         
         owner, repo = repo_match.groups()
         
-        async with aiohttp.ClientSession(timeout=self.timeout) as session:
+        async with self._client_session() as session:
             headers = self.headers.copy()
             if self.github_token:
                 headers['Authorization'] = f'token {self.github_token}'
@@ -128,7 +161,7 @@ class UnifiedActivityAssessment:
                     if response.status != 200:
                         return {'activity_score': 0.0, 'error': f'GitHub API error: {response.status}'}
                     
-                    repo_data = await response.json()
+                    repo_data = await response.json(loads=_json_loads)
                     
                     # Get recent commits
                     commits_url = f'https://api.github.com/repos/{owner}/{repo}/commits'
@@ -138,7 +171,7 @@ class UnifiedActivityAssessment:
                     try:
                         async with session.get(commits_url, headers=headers, params=params) as commits_response:
                             if commits_response.status == 200:
-                                recent_commits = await commits_response.json()
+                                recent_commits = await commits_response.json(loads=_json_loads)
                     except:
                         pass  # Continue without recent commits data
                     
@@ -199,7 +232,7 @@ class UnifiedActivityAssessment:
         package_name = npm_match.group(1)
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with self._client_session() as session:
                 # Get package info
                 package_url = f'https://registry.npmjs.org/{package_name}'
                 
@@ -207,7 +240,7 @@ class UnifiedActivityAssessment:
                     if response.status != 200:
                         return {'activity_score': 0.0, 'error': f'NPM API error: {response.status}'}
                     
-                    package_data = await response.json()
+                    package_data = await response.json(loads=_json_loads)
                     
                     # Simple NPM scoring
                     score = 0.5  # Base score for existing package
@@ -247,14 +280,14 @@ class UnifiedActivityAssessment:
         package_name = pypi_match.group(1)
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with self._client_session() as session:
                 package_url = f'https://pypi.org/pypi/{package_name}/json'
                 
                 async with session.get(package_url, headers=self.headers) as response:
                     if response.status != 200:
                         return {'activity_score': 0.0, 'error': f'PyPI API error: {response.status}'}
                     
-                    package_data = await response.json()
+                    package_data = await response.json(loads=_json_loads)
                     
                     # Simple PyPI scoring
                     score = 0.5  # Base score
@@ -291,7 +324,7 @@ class UnifiedActivityAssessment:
             return {'activity_score': 0.0, 'error': 'No website URL'}
         
         try:
-            async with aiohttp.ClientSession(timeout=self.timeout) as session:
+            async with self._client_session() as session:
                 async with session.get(tool.website, headers=self.headers) as response:
                     is_healthy = response.status == 200
                     has_ssl = str(response.url).startswith('https://')
@@ -3,140 +3,544 @@
 # FIXED VERSION - Complete file with proper dead website handling and better retry logic
 
 import time
+import argparse
+import asyncio
 import logging
 import sys
 import os
-from datetime import datetime, timedelta
-from typing import Optional, Dict, Any
+import random
+import threading
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor, as_completed, TimeoutError as FuturesTimeoutError
+from dataclasses import dataclass
+from functools import lru_cache
+from datetime import datetime, timedelta, timezone
+from types import MappingProxyType
+from typing import Optional, Dict, Any, Mapping, Tuple, Callable
+from urllib.parse import urlparse
 import json
 
-sys.path.insert(0, os.path.dirname(__file__))
+# Optional fast JSON backend for the state file
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-from app.services.real_apis_service import unified_apis_service
+_MODULE_DIR = os.path.dirname(__file__)
+if _MODULE_DIR not in sys.path:
+    sys.path.insert(0, _MODULE_DIR)
 
-# Import AI directory scraping service
-try:
-    from app.services.ai_directory_service import ai_directory_service
-    DIRECTORY_SCRAPING_AVAILABLE = True
-except ImportError as e:
-    DIRECTORY_SCRAPING_AVAILABLE = False
-    print(f"⚠️ AI Directory scraping not available: {e}")
+# Discovery, scraping and scoring services (HTTP clients, DB engine) are imported
+# by _load_services() on first use, so state/setup/reset commands start instantly
+DIRECTORY_SCRAPING_AVAILABLE = False
+ACTIVITY_SCORING_AVAILABLE = False
+_services_loaded = False
 
-# Import activity assessment
-try:
-    from app.services.unified_activity_service import unified_activity_service
-    from app.db.database import SessionLocal
-    from app.models.chat import DiscoveredTool
-    from sqlalchemy import and_, or_
-    ACTIVITY_SCORING_AVAILABLE = True
-except ImportError as e:
-    ACTIVITY_SCORING_AVAILABLE = False
-    print(f"⚠️ Activity scoring not available: {e}")
+
+def _load_services():
+    """Import the discovery, scraping and scoring services (once)"""
+    global _services_loaded, DIRECTORY_SCRAPING_AVAILABLE, ACTIVITY_SCORING_AVAILABLE
+    global unified_apis_service, ai_directory_service, unified_activity_service
+    global SessionLocal, DiscoveredTool, and_, or_, tuple_, func, case
+    if _services_loaded:
+        return
+    
+    from app.services.real_apis_service import unified_apis_service
+    
+    # Import AI directory scraping service
+    try:
+        from app.services.ai_directory_service import ai_directory_service
+        DIRECTORY_SCRAPING_AVAILABLE = True
+    except ImportError as e:
+        DIRECTORY_SCRAPING_AVAILABLE = False
+        print(f"⚠️ AI Directory scraping not available: {e}")
+    
+    # Import activity assessment
+    try:
+        from app.services.unified_activity_service import unified_activity_service
+        from app.db.database import SessionLocal
+        from app.models.chat import DiscoveredTool
+        from sqlalchemy import and_, or_, tuple_, func, case
+        ACTIVITY_SCORING_AVAILABLE = True
+    except ImportError as e:
+        ACTIVITY_SCORING_AVAILABLE = False
+        print(f"⚠️ Activity scoring not available: {e}")
+    
+    _services_loaded = True
 
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Log formats for the per-tool scoring hot path (interpolated lazily by logging)
+_LOG_SCORING = "  ⚡ %s #%d: %s"
+_LOG_SCORE_OK = "    ✅ %s | Score: %.2f | Type: %s"
+_LOG_SCORE_FAILED = "    ❌ FAILED | Score: %.2f | Error: %.50s..."
+_LOG_ASSESSMENT_FAILED = "    💥 ASSESSMENT FAILED | Score: 0.00 | Site status unchanged"
+_LOG_SCORE_ERROR = "    ❌ Error scoring %s: %s"
+_LOG_SAMPLE = "  🎯 %s: %.2f (%s)%s%s"
+_LOG_DEAD_READY = "  %2d. %-40.40s | Status: %s | %dd ago | %d fails"
+_LOG_DEAD_COOLDOWN = "  %2d. %-40.40s | Status: %s | %.1fh left"
+
+# test_apis entries served by the AI directory scraper rather than the API service
+_AI_DIRECTORY_APIS = frozenset({"There's An AI For That", "AI Tools Directory", "Futurepedia"})
+
+# Incremental params shared by every test_apis probe (only last_check_times varies)
+_TEST_PARAMS_BASE = MappingProxyType({"force_full_scan": False, "incremental_mode": True})
+
+_RETRY_BACKOFF_START = 60  # seconds before the first retry of a failed continuous cycle
+_API_TEST_TIMEOUT = 60  # seconds test_apis waits for the slowest API probe
+_SCORING_CONCURRENCY = int(os.getenv("SCORING_CONCURRENCY", "32"))  # in-flight assessments per batch
+_SCORING_CHUNK = 50  # rows fetched, assessed and committed per batch
+# Columns the scoring pass reads - fetched as plain row tuples, never as ORM objects
+_SCORING_COLUMNS = (
+    "id", "name", "website", "description", "activity_score", "website_status",
+    "is_actively_maintained", "github_stars", "npm_weekly_downloads", "consecutive_failures",
+)
+
+
+@dataclass(frozen=True, slots=True)
+class DiscoveryConfig:
+    """Immutable settings for one discovery method"""
+    method: str
+    target: int
+    description: str
+    include_directories: bool
+    directories_only: bool = False
+
+
+# Available discovery methods with incremental support (built once at import)
+DISCOVERY_METHODS: Mapping[str, DiscoveryConfig] = MappingProxyType({
+    "enhanced_all": DiscoveryConfig(
+        method="run_sync_discover_all_real_apis_incremental",
+        target=500,
+        description="All APIs + AI Directories + Incremental Updates + Auto Activity Scoring",
+        include_directories=True,
+    ),
+    "standard": DiscoveryConfig(
+        method="run_sync_discover_no_auth_apis_incremental",
+        target=200,
+        description="No-auth APIs + AI Directories + Incremental Updates + Auto Activity Scoring",
+        include_directories=True,
+    ),
+    "directories_only": DiscoveryConfig(
+        method="run_sync_scrape_all_directories_incremental",
+        target=300,
+        description="AI Directories Only + Incremental Updates + Auto Activity Scoring",
+        include_directories=True,
+        directories_only=True,
+    ),
+    "github": DiscoveryConfig(
+        method="run_sync_discover_github_incremental",
+        target=150,
+        description="GitHub + Incremental Updates + Auto Activity Scoring",
+        include_directories=False,
+    ),
+    "npm": DiscoveryConfig(
+        method="run_sync_discover_npm_incremental",
+        target=100,
+        description="NPM + Incremental Updates + Auto Activity Scoring",
+        include_directories=False,
+    ),
+    "reddit": DiscoveryConfig(
+        method="run_sync_discover_reddit_incremental",
+        target=100,
+        description="Reddit + Incremental Updates + Auto Activity Scoring",
+        include_directories=False,
+    ),
+    "hackernews": DiscoveryConfig(
+        method="run_sync_discover_hackernews_incremental",
+        target=100,
+        description="Hacker News + Incremental Updates + Auto Activity Scoring",
+        include_directories=False,
+    ),
+    "stackoverflow": DiscoveryConfig(
+        method="run_sync_discover_stackoverflow_incremental",
+        target=100,
+        description="Stack Overflow + Incremental Updates + Auto Activity Scoring",
+        include_directories=False,
+    ),
+    "pypi": DiscoveryConfig(
+        method="run_sync_discover_pypi_incremental",
+        target=100,
+        description="PyPI + Incremental Updates + Auto Activity Scoring",
+        include_directories=False,
+    ),
+    "theresanaiforthat": DiscoveryConfig(
+        method="run_sync_scrape_theresanaiforthat_incremental",
+        target=100,
+        description="There's An AI For That Directory + Incremental Updates + Auto Activity Scoring",
+        include_directories=True,
+        directories_only=True,
+    ),
+    "aitoolsdirectory": DiscoveryConfig(
+        method="run_sync_scrape_aitoolsdirectory_incremental",
+        target=100,
+        description="AI Tools Directory + Incremental Updates + Auto Activity Scoring",
+        include_directories=True,
+        directories_only=True,
+    ),
+    "futurepedia": DiscoveryConfig(
+        method="run_sync_scrape_futurepedia_incremental",
+        target=100,
+        description="Futurepedia Directory + Incremental Updates + Auto Activity Scoring",
+        include_directories=True,
+        directories_only=True,
+    ),
+})
+
+# APIs whose last check times feed each discovery method's incremental params
+_METHOD_TO_APIS: Mapping[str, Tuple[str, ...]] = MappingProxyType({
+    "enhanced_all": ("github", "npm", "reddit", "hackernews", "stackoverflow", "pypi", "directories"),
+    "standard": ("github", "npm", "hackernews", "stackoverflow", "directories"),
+    "directories_only": ("directories",),
+    # Single directory / single API methods
+    "theresanaiforthat": ("theresanaiforthat",),
+    "aitoolsdirectory": ("aitoolsdirectory",),
+    "futurepedia": ("futurepedia",),
+    "github": ("github",),
+    "npm": ("npm",),
+    "reddit": ("reddit",),
+    "hackernews": ("hackernews",),
+    "stackoverflow": ("stackoverflow",),
+    "pypi": ("pypi",),
+})
+
+# FIXED: Map lowercase method names to actual saved API names in state file
+_API_STATE_NAMES: Mapping[str, str] = MappingProxyType({
+    "github": "GitHub",
+    "npm": "NPM",
+    "reddit": "Reddit",
+    "hackernews": "Hacker News",
+    "stackoverflow": "Stack Overflow",
+    "pypi": "PyPI",
+    "directories": "directories",
+})
+
+# (api_key, state file name) pairs per method, resolved once instead of on every run
+_METHOD_API_KEYS: Mapping[str, Tuple[Tuple[str, str], ...]] = MappingProxyType({
+    method: tuple((api_key, _API_STATE_NAMES.get(api_key, api_key)) for api_key in api_keys)
+    for method, api_keys in _METHOD_TO_APIS.items()
+})
+
+# Website hosts whose assessment actually hits a different API host
+_ASSESSMENT_API_HOSTS = MappingProxyType({
+    "github.com": "api.github.com",
+    "www.github.com": "api.github.com",
+    "npmjs.com": "registry.npmjs.org",
+    "www.npmjs.com": "registry.npmjs.org",
+})
+
+# Hosts serving many unrelated projects - one failed probe there says nothing about the host
+_SHARED_CODE_HOSTS = frozenset({
+    "github.com", "www.github.com", "gitlab.com", "bitbucket.org", "npmjs.com", "www.npmjs.com",
+    "pypi.org", "huggingface.co", "hub.docker.com",
+})
+
+@dataclass(frozen=True, slots=True)
+class HealthPolicy:
+    """Retry cooldown for dead sites: doubles with each consecutive failed probe, up to a cap"""
+    base_cooldown_seconds: float = 86400.0
+    max_cooldown_seconds: float = 7 * 86400.0
+    
+    def cooldown(self, consecutive_failures: int) -> timedelta:
+        """How long to wait before probing a site that has failed this many times in a row"""
+        doublings = min(max(consecutive_failures - 1, 0), 16)
+        return timedelta(seconds=min(self.base_cooldown_seconds * 2 ** doublings, self.max_cooldown_seconds))
+
+
+HEALTH_POLICY = HealthPolicy()
+# Legacy dead sites without a cooldown_until are retried with the normal rescore window
+_RESCORE_AFTER = timedelta(days=7)
+
+
+def _is_dead_status(status: Optional[int]) -> bool:
+    """Website status recorded for an unreachable or erroring site"""
+    return status is not None and (status == 0 or status >= 400)
+
+
+class HostRateLimiter:
+    """Token-bucket rate limiter keyed by hostname (only same-host calls wait)"""
+    
+    # Requests per second allowed per upstream host
+    HOST_RATES = {
+        "api.github.com": 1.4,       # 5000/hr authenticated
+        "registry.npmjs.org": 10.0,
+        "pypi.org": 5.0,
+    }
+    DEFAULT_RATE = 2.0
+    
+    def __init__(self, rates: Optional[Dict[str, float]] = None, default_rate: float = DEFAULT_RATE):
+        self.rates = {**self.HOST_RATES, **(rates or {})}
+        self.default_rate = default_rate
+        self._buckets: Dict[str, Tuple[float, float]] = {}  # host -> (tokens, last_refill)
+        self._lock = threading.Lock()
+    
+    @staticmethod
+    def host_for(website: Optional[str]) -> str:
+        """Host that assessing this website will actually contact"""
+        host = urlparse(website or "").netloc.lower()
+        return _ASSESSMENT_API_HOSTS.get(host, host)
+    
+    def reserve(self, host: str) -> float:
+        """Take one token for host and return how long the caller must wait before using it"""
+        rate = self.rates.get(host, self.default_rate)
+        capacity = max(rate, 1.0)
+        
+        with self._lock:
+            now = time.monotonic()
+            tokens, last_refill = self._buckets.get(host, (capacity, now))
+            tokens = min(capacity, tokens + (now - last_refill) * rate)
+            # Reserve the token now (may go negative) so concurrent callers queue up
+            self._buckets[host] = (tokens - 1.0, now)
+        
+        return max(0.0, (1.0 - tokens) / rate)
+
+
+class TTLCache:
+    """Small thread-safe LRU cache whose entries also expire after ttl seconds"""
+    
+    def __init__(self, maxsize: int = 4096, ttl: float = 3600.0):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: "OrderedDict[Any, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+    
+    def get(self, key, default=None):
+        with self._lock:
+            item = self._data.get(key)
+            if item is None:
+                return default
+            expires_at, value = item
+            if expires_at < time.monotonic():
+                del self._data[key]
+                return default
+            self._data.move_to_end(key)
+            return value
+    
+    def set(self, key, value):
+        with self._lock:
+            self._data[key] = (time.monotonic() + self.ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+    
+    def clear(self):
+        with self._lock:
+            self._data.clear()
+
+
+# Community size score: stars and weekly downloads saturate at these caps
+_STARS_CAP = 1000
+_DOWNLOADS_CAP = 10000
+_STARS_WEIGHT = 0.6 / _STARS_CAP
+_DOWNLOADS_WEIGHT = 0.4 / _DOWNLOADS_CAP
+
+
+def _json_load(f) -> Any:
+    """Load JSON from a binary file, using orjson when installed"""
+    data = f.read()
+    return orjson.loads(data) if ORJSON_AVAILABLE else json.loads(data)
+
+
+def _json_dump(obj: Any, f):
+    """Write indented, key-sorted JSON to a binary file, using orjson when installed"""
+    if ORJSON_AVAILABLE:
+        f.write(orjson.dumps(obj, option=orjson.OPT_INDENT_2 | orjson.OPT_SORT_KEYS, default=str))
+    else:
+        f.write(json.dumps(obj, indent=2, sort_keys=True, default=str).encode())
+
+
+@lru_cache(maxsize=1)
+def _api_configuration_lines() -> Tuple[str, ...]:
+    """API configuration report - only depends on import-time availability, so built once"""
+    lines = [
+        "🔧 API Configuration Status:",
+        # Always available
+        "  ✅ GitHub API: Available (incremental via updated_at)",
+        "  ✅ NPM Registry API: Available (incremental via modified)",
+        "  ✅ PyPI JSON API: Available",
+        "  ✅ Hacker News API: Available (incremental via timestamp)",
+        "  ✅ Stack Overflow API: Available (incremental via last_activity_date)",
+        "  ✅ Reddit API: Available (incremental via created_utc)",
+    ]
+    
+    # AI Directory Scraping
+    if DIRECTORY_SCRAPING_AVAILABLE:
+        lines += [
+            "  ✅ AI Directory Scraping: Available",
+            "    • There's An AI For That: Incremental (daily checks)",
+            "    • AI Tools Directory: Incremental (daily checks)",
+            "    • Futurepedia: Incremental (daily checks)",
+        ]
+    else:
+        lines.append("  ❌ AI Directory Scraping: Not available")
+    
+    # Check activity scoring
+    lines.append("  ✅ Activity Scoring: Available" if ACTIVITY_SCORING_AVAILABLE else "  ❌ Activity Scoring: Not available")
+    return tuple(lines)
+
+
+_INCREMENTAL_FEATURES = (
+    "\n🔧 Incremental Features:",
+    "  ✅ Per-API last check tracking",
+    "  ✅ Automatic weekly full scans",
+    "  ✅ Smart activity score updates",
+    "  ✅ Persistent state management",
+    "  ✅ Efficiency metrics and skip tracking",
+    "  ✅ AI Directory scraping integration",
+    "  ✅ Dead website cooldown system",
+)
+
+
+_SETUP_TEXT = """🛠️ Incremental Discovery Setup:
+
+⚡ KEY ADVANTAGE: Only checks tools updated since last run!
+💡 Dramatically reduces API calls and processing time
+📊 Tracks state in discovery_state.json
+💀 Smart dead website handling with backoff cooldowns (1 day, doubling up to 7 days)
+
+🎯 FIXED ISSUES:
+✅ Dead websites get proper activity_score=0.0
+✅ Dead websites aren't retried every run (1-day cooldown, doubling per failure up to 7 days)
+✅ Realistic tool counts (no more 208 when only 104 discovered)
+✅ Better failure handling and logging
+
+💾 STATE MANAGEMENT:
+• Tracks last check time per API
+• Automatic weekly full scans
+• Persistent state file (discovery_state.json)
+• Dead website cooldown tracking
+
+💀 DEAD WEBSITE COMMANDS:
+• Show dead sites: python intelligent_discovery.py show-dead
+• Reset cooldowns: python intelligent_discovery.py reset-dead
+
+✅ Test your setup:
+python intelligent_discovery.py state"""
+
+
+def _parse_iso(timestamp: str) -> datetime:
+    """Parse an ISO-8601 timestamp (trailing 'Z' allowed) into a naive UTC datetime"""
+    parsed = datetime.fromisoformat(timestamp.replace("Z", "+00:00"))
+    if parsed.tzinfo is not None:
+        parsed = parsed.astimezone(timezone.utc).replace(tzinfo=None)
+    return parsed
+
+
+def _to_epoch(timestamp: datetime) -> float:
+    """Convert a naive UTC datetime to epoch seconds"""
+    return timestamp.replace(tzinfo=timezone.utc).timestamp()
+
+
+def _scoring_columns() -> tuple:
+    """DiscoveredTool attributes for _SCORING_COLUMNS (the model is imported lazily)"""
+    return tuple(getattr(DiscoveredTool, c) for c in _SCORING_COLUMNS)
+
+
+@lru_cache(maxsize=1)
+def _dead_site_filter():
+    """Dead-site cohort shared by show-dead and reset-dead (built once, after the model is imported)"""
+    return and_(
+        or_(
+            DiscoveredTool.website_status == 0,
+            DiscoveredTool.website_status >= 400
+        ),
+        DiscoveredTool.activity_score == 0.0,
+        DiscoveredTool.last_activity_check.isnot(None)
+    )
+
+
+@lru_cache(maxsize=64)
+def _from_epoch(timestamp: float) -> datetime:
+    """Naive UTC datetime for stored epoch seconds (memoized - the same values are read every run)"""
+    return datetime.utcfromtimestamp(timestamp)
+
+
+def _dead_host_for(website: Optional[str]) -> Optional[str]:
+    """Host whose unreachability can be shared between tools (None for multi-project code hosts)"""
+    host = urlparse(website or "").netloc.lower()
+    if not host or host in _SHARED_CODE_HOSTS:
+        return None
+    return host
+
+
+def _probe_key(website: Optional[str]) -> str:
+    """Cache key for a tool's assessment: the full normalized URL (the scores are per-URL, not per-host)"""
+    parsed = urlparse((website or "").strip())
+    path = parsed.path.rstrip("/")
+    return f"{parsed.netloc.lower()}{path}?{parsed.query}" if parsed.query else f"{parsed.netloc.lower()}{path}"
+
+
 class IncrementalDiscoverySystem:
     """
     FIXED VERSION - Incremental Discovery System with proper dead website handling
     Key fixes:
     1. Dead websites get properly marked with activity_score=0.0
-    2. Dead websites aren't retried every run (3-day cooldown)
+    2. Dead websites aren't retried every run (per-tool cooldown, doubling up to 7 days)
     3. Better tool count management
     4. Smarter retry logic for failed assessments
+    
+    Schema: the scoring queries rely on the partial indexes idx_tool_stale_score,
+    idx_tool_unscored and idx_tool_needs_scoring (alembic scoring_indexes_001 and
+    scoring_order_index_001) - run the migrations before large scoring sweeps.
     """
     
+    discovery_methods: Mapping[str, DiscoveryConfig] = DISCOVERY_METHODS
+    # Derived once from the frozen method table
+    method_names: Tuple[str, ...] = tuple(DISCOVERY_METHODS)
+    method_help = "\n".join(f"  • {m}: {c.description}" for m, c in DISCOVERY_METHODS.items())
+    method_status = "\n".join(
+        f"  • {m}: {c.description} (target: {c.target})" for m, c in DISCOVERY_METHODS.items()
+    )
+    
     def __init__(self, state_file: str = "discovery_state.json"):
         self.state_file = state_file
+        self.state_path = os.path.abspath(state_file)  # resolved once for status output
         self.stats = {"runs": 0, "tools_found": 0, "tools_scored": 0, "tools_skipped": 0}
         self.state = self._load_state()
+        self.rate_limiter = HostRateLimiter()
+        self.probe_cache = TTLCache(maxsize=4096, ttl=3600)  # shared across the whole run
+        self._resolved_methods = None
+    
+    def _ensure_services(self):
+        """Load the services and wire them up on first use"""
+        if self._resolved_methods is not None:
+            return
+        _load_services()
         
-        # Available discovery methods with incremental support
-        self.discovery_methods = {
-            "enhanced_all": {
-                "method": "run_sync_discover_all_real_apis_incremental",
-                "target": 500,
-                "description": "All APIs + AI Directories + Incremental Updates + Auto Activity Scoring",
-                "include_directories": True
-            },
-            "standard": {
-                "method": "run_sync_discover_no_auth_apis_incremental", 
-                "target": 200,
-                "description": "No-auth APIs + AI Directories + Incremental Updates + Auto Activity Scoring",
-                "include_directories": True
-            },
-            "directories_only": {
-                "method": "run_sync_scrape_all_directories_incremental",
-                "target": 300,
-                "description": "AI Directories Only + Incremental Updates + Auto Activity Scoring",
-                "include_directories": True,
-                "directories_only": True
-            },
-            "github": {
-                "method": "run_sync_discover_github_incremental",
-                "target": 150,
-                "description": "GitHub + Incremental Updates + Auto Activity Scoring",
-                "include_directories": False
-            },
-            "npm": {
-                "method": "run_sync_discover_npm_incremental",
-                "target": 100,
-                "description": "NPM + Incremental Updates + Auto Activity Scoring",
-                "include_directories": False
-            },
-            "reddit": {
-                "method": "run_sync_discover_reddit_incremental",
-                "target": 100,
-                "description": "Reddit + Incremental Updates + Auto Activity Scoring",
-                "include_directories": False
-            },
-            "hackernews": {
-                "method": "run_sync_discover_hackernews_incremental",
-                "target": 100,
-                "description": "Hacker News + Incremental Updates + Auto Activity Scoring",
-                "include_directories": False
-            },
-            "stackoverflow": {
-                "method": "run_sync_discover_stackoverflow_incremental",
-                "target": 100,
-                "description": "Stack Overflow + Incremental Updates + Auto Activity Scoring",
-                "include_directories": False
-            },
-            "pypi": {
-                "method": "run_sync_discover_pypi_incremental",
-                "target": 100,
-                "description": "PyPI + Incremental Updates + Auto Activity Scoring",
-                "include_directories": False
-            },
-            "theresanaiforthat": {
-                "method": "run_sync_scrape_theresanaiforthat_incremental",
-                "target": 100,
-                "description": "There's An AI For That Directory + Incremental Updates + Auto Activity Scoring",
-                "include_directories": True,
-                "directories_only": True
-            },
-            "aitoolsdirectory": {
-                "method": "run_sync_scrape_aitoolsdirectory_incremental", 
-                "target": 100,
-                "description": "AI Tools Directory + Incremental Updates + Auto Activity Scoring",
-                "include_directories": True,
-                "directories_only": True
-            },
-            "futurepedia": {
-                "method": "run_sync_scrape_futurepedia_incremental",
-                "target": 100,
-                "description": "Futurepedia Directory + Incremental Updates + Auto Activity Scoring", 
-                "include_directories": True,
-                "directories_only": True
-            }
+        # Resolve each API discovery method once instead of hasattr/getattr on every run
+        self._resolved_methods = {
+            config.method: self._resolve_api_method(config)
+            for config in self.discovery_methods.values()
+            if not config.directories_only
         }
+        # Report missing service methods once at startup rather than on each run
+        for method_name, (api_method, _) in self._resolved_methods.items():
+            if api_method is None:
+                logger.warning(f"⚠️ API service has no method {method_name} (or its non-incremental fallback)")
     
     def _load_state(self) -> Dict[str, Any]:
         """Load state from file or create new state"""
         try:
             if os.path.exists(self.state_file):
-                with open(self.state_file, 'r') as f:
-                    state = json.load(f)
+                with open(self.state_file, 'rb') as f:
+                    state = _json_load(f)
+                # Older state files stored ISO strings - convert them to epoch seconds once
+                api_checks = state.get("api_last_checks") or {}
+                for api_name, timestamp in list(api_checks.items()):
+                    if isinstance(timestamp, str):
+                        try:
+                            api_checks[api_name] = _to_epoch(_parse_iso(timestamp))
+                        except ValueError:
+                            logger.warning(f"⚠️ Dropping unreadable last check time for {api_name}: {timestamp!r}")
+                            del api_checks[api_name]
+                if isinstance(state.get("last_full_scan"), str):
+                    try:
+                        state["last_full_scan"] = _to_epoch(_parse_iso(state["last_full_scan"]))
+                    except ValueError:
+                        logger.warning(f"⚠️ Dropping unreadable last full scan time: {state['last_full_scan']!r}")
+                        state["last_full_scan"] = None
                 logger.info(f"📂 Loaded state from {self.state_file}")
                 return state
         except Exception as e:
@@ -154,58 +558,66 @@ class IncrementalDiscoverySystem:
     
     def _save_state(self):
         """Save current state to file"""
+        self.state["total_runs"] = self.stats["runs"]
+        # Write a temp file and swap it in, so a crash mid-write never leaves a corrupt state file
+        tmp_file = self.state_file + ".tmp"
         try:
-            self.state["total_runs"] = self.stats["runs"]
-            with open(self.state_file, 'w') as f:
-                json.dump(self.state, f, indent=2, default=str)
+            with open(tmp_file, 'wb') as f:
+                _json_dump(self.state, f)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp_file, self.state_file)
             logger.debug(f"💾 State saved to {self.state_file}")
         except Exception as e:
             logger.error(f"❌ Could not save state: {e}")
+            # The previous state file is untouched - just don't leave the partial write behind
+            try:
+                os.remove(tmp_file)
+            except OSError:
+                pass
     
-    def _should_force_full_scan(self) -> bool:
-        """Check if we should force a full scan (e.g., weekly)"""
-        if not self.state.get("last_full_scan"):
+    def _should_force_full_scan(self, now: Optional[float] = None) -> bool:
+        """Check if we should force a full scan (e.g., weekly); now is the run's captured epoch time"""
+        last_full_scan = self.state.get("last_full_scan")
+        if not last_full_scan:
             return True
         
-        last_full = datetime.fromisoformat(self.state["last_full_scan"])
-        days_since = (datetime.utcnow() - last_full).days
+        # Stored as epoch seconds - a plain float comparison, nothing to parse
         force_after = self.state.get("force_full_scan_after_days", 7)
-        
-        return days_since >= force_after
+        return (time.time() if now is None else now) - last_full_scan >= force_after * 86400
     
     def _get_last_check_time(self, api_name: str) -> Optional[datetime]:
         """Get the last time we checked this API"""
         timestamp = self.state["api_last_checks"].get(api_name)
         if timestamp:
-            return datetime.fromisoformat(timestamp)
+            return _from_epoch(timestamp)
         return None
     
     def _update_last_check_time(self, api_name: str, timestamp: datetime = None):
-        """Update the last check time for an API"""
-        if timestamp is None:
-            timestamp = datetime.utcnow()
-        self.state["api_last_checks"][api_name] = timestamp.isoformat()
+        """Update the last check time for an API (stored as epoch seconds)"""
+        self.state["api_last_checks"][api_name] = time.time() if timestamp is None else _to_epoch(timestamp)
     
     def run_incremental_discovery(self, method: str = "enhanced_all", auto_score: bool = True, force_full: bool = False):
         """Run incremental discovery - only check updated tools"""
+        self._ensure_services()
         
         if method not in self.discovery_methods:
             logger.error(f"❌ Unknown discovery method: {method}")
-            logger.info(f"Available methods: {list(self.discovery_methods.keys())}")
+            logger.info(f"Available methods: {list(self.method_names)}")
             return {"new_tools": 0, "scored_tools": 0, "skipped_tools": 0}
         
         config = self.discovery_methods[method]
         current_time = datetime.utcnow()
         
         # Check if we should force a full scan
-        force_full = force_full or self._should_force_full_scan()
+        force_full = force_full or self._should_force_full_scan(_to_epoch(current_time))
         
         logger.info(f"🧠 Incremental Discovery Starting - Method: {method}")
-        logger.info(f"🎯 {config['description']}")
+        logger.info(f"🎯 {config.description}")
         
         if force_full:
             logger.info(f"🔄 FULL SCAN MODE (weekly refresh)")
-            self.state["last_full_scan"] = current_time.isoformat()
+            self.state["last_full_scan"] = _to_epoch(current_time)
         else:
             logger.info(f"⚡ INCREMENTAL MODE (changes only)")
         
@@ -228,9 +640,11 @@ class IncrementalDiscoverySystem:
             total_dir_new = 0
             total_dir_skipped = 0
             
-            # Run API discovery (unless it's directories-only)
-            if not config.get("directories_only", False):
-                api_result = self._run_incremental_api_discovery(config, discovery_params)
+            # API discovery and directory scraping are independent network work - run them together
+            api_result, dir_result = asyncio.run(self._run_discovery_sources_async(config, discovery_params))
+            
+            # API discovery results (unless it's directories-only)
+            if not config.directories_only:
                 total_api_new = api_result.get("total_saved", 0)
                 total_api_skipped = api_result.get("total_skipped", 0)
                 
@@ -238,60 +652,48 @@ class IncrementalDiscoverySystem:
                 if api_result.get("api_results"):
                     logger.info("📡 API Results:")
                     for api_name, api_result_detail in api_result["api_results"].items():
-                        if api_result_detail.get("success"):
-                            tools_count = api_result_detail.get("tools_discovered", 0)
-                            skipped_count = api_result_detail.get("tools_skipped", 0)
-                            processing_time = api_result_detail.get("processing_time", 0)
+                        get = api_result_detail.get
+                        if get("success"):
+                            tools_count = get("tools_discovered", 0)
+                            skipped_count = get("tools_skipped", 0)
+                            processing_time = get("processing_time", 0)
                             logger.info(f"  ✅ {api_name}: {tools_count} new, {skipped_count} skipped ({processing_time:.1f}s)")
                             
                             # Update last check time for this API
                             self._update_last_check_time(api_name, current_time)
                         else:
-                            error = api_result_detail.get("error", "Unknown error")
+                            error = get("error", "Unknown error")
                             logger.info(f"  ❌ {api_name}: {error}")
             
-            # Run directory scraping if enabled and available
-            if config.get("include_directories", False) and DIRECTORY_SCRAPING_AVAILABLE:
+            # Directory scraping results if enabled and available
+            if config.include_directories and DIRECTORY_SCRAPING_AVAILABLE:
                 logger.info("\n🤖 AI DIRECTORY SCRAPING")
                 
-                if config.get("directories_only", False):
-                    # Use the specific directory method
-                    directory_method = getattr(ai_directory_service, config["method"])
-                    dir_result = directory_method(
-                        target_tools=config["target"],
-                        incremental_params=discovery_params
-                    )
-                else:
-                    # Use all directories method
-                    dir_result = ai_directory_service.run_sync_scrape_all_directories_incremental(
-                        target_tools=min(config["target"] // 2, 150),  # Use half target for directories
-                        incremental_params=discovery_params
-                    )
+                get = dir_result.get
+                total_dir_new = get("total_saved", 0)
+                total_dir_skipped = get("total_skipped", 0)
                 
-                total_dir_new = dir_result.get("total_saved", 0)
-                total_dir_skipped = dir_result.get("total_skipped", 0)
-                
-                if dir_result.get("success"):
-                    if dir_result.get("incremental_skip"):
+                if get("success"):
+                    if get("incremental_skip"):
                         logger.info(f"  ⏭️ AI Directories: Skipped (recently checked)")
                     else:
-                        scraped = dir_result.get("total_scraped", 0)
-                        saved = dir_result.get("total_saved", 0)
-                        duplicates = dir_result.get("total_duplicates", 0)
-                        processing_time = dir_result.get("processing_time", 0)
+                        scraped = get("total_scraped", 0)
+                        saved = total_dir_new
+                        duplicates = get("total_duplicates", 0)
+                        processing_time = get("processing_time", 0)
                         logger.info(f"  ✅ AI Directories: {scraped} scraped, {saved} saved, {duplicates} duplicates ({processing_time:.1f}s)")
                         
                         # Update directory check time
-                        if config.get("directories_only"):
+                        if config.directories_only:
                             directory_name = method  # For single directory methods
                         else:
                             directory_name = "directories"
                         self._update_last_check_time(directory_name, current_time)
                 else:
-                    error = dir_result.get("error", "Unknown error")
+                    error = get("error", "Unknown error")
                     logger.info(f"  ❌ AI Directories: {error}")
             
-            elif config.get("include_directories", False) and not DIRECTORY_SCRAPING_AVAILABLE:
+            elif config.include_directories and not DIRECTORY_SCRAPING_AVAILABLE:
                 logger.warning("⚠️ AI Directory scraping requested but not available")
             
             # Combine results
@@ -340,6 +742,38 @@ class IncrementalDiscoverySystem:
         
         return {"new_tools": total_new, "scored_tools": total_scored, "skipped_tools": total_skipped}
     
+    async def _run_discovery_sources_async(self, config: DiscoveryConfig, params: Dict[str, Any]) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """Run API discovery and directory scraping concurrently: (api_result, dir_result)"""
+        empty = {"total_saved": 0, "total_skipped": 0, "api_results": {}}
+        
+        async def api_task():
+            if config.directories_only:
+                return empty
+            return await asyncio.to_thread(self._run_incremental_api_discovery, config, params)
+        
+        async def dir_task():
+            if not (config.include_directories and DIRECTORY_SCRAPING_AVAILABLE):
+                return {}
+            return await asyncio.to_thread(self._run_directory_discovery, config, params)
+        
+        return tuple(await asyncio.gather(api_task(), dir_task()))
+    
+    def _run_directory_discovery(self, config: DiscoveryConfig, params: Dict[str, Any]) -> Dict[str, Any]:
+        """Run AI directory scraping for a discovery config"""
+        if config.directories_only:
+            # Use the specific directory method
+            directory_method = getattr(ai_directory_service, config.method)
+            return directory_method(
+                target_tools=config.target,
+                incremental_params=params
+            )
+        
+        # Use all directories method
+        return ai_directory_service.run_sync_scrape_all_directories_incremental(
+            target_tools=min(config.target // 2, 150),  # Use half target for directories
+            incremental_params=params
+        )
+    
     def _prepare_incremental_params(self, method: str, force_full: bool) -> Dict[str, Any]:
         """Prepare parameters for incremental discovery - FIXED API name mapping"""
         params = {
@@ -348,34 +782,9 @@ class IncrementalDiscoverySystem:
             "incremental_mode": not force_full
         }
         
-        # FIXED: Map lowercase method names to actual saved API names in state file
-        api_name_mapping = {
-            "github": "GitHub",
-            "npm": "NPM", 
-            "reddit": "Reddit",
-            "hackernews": "Hacker News",
-            "stackoverflow": "Stack Overflow",
-            "pypi": "PyPI",
-            "directories": "directories"  # This one was already correct
-        }
-        
         # Get last check times for each API we'll use
-        if method == "enhanced_all":
-            method_apis = ["github", "npm", "reddit", "hackernews", "stackoverflow", "pypi", "directories"]
-        elif method == "standard":
-            method_apis = ["github", "npm", "hackernews", "stackoverflow", "directories"]
-        elif method == "directories_only":
-            method_apis = ["directories"]
-        elif method in ["theresanaiforthat", "aitoolsdirectory", "futurepedia"]:
-            method_apis = [method]  # Single directory
-        elif method in ["github", "npm", "reddit", "hackernews", "stackoverflow", "pypi"]:
-            method_apis = [method]
-        else:
-            method_apis = []
-        
-        for api_key in method_apis:
-            # FIXED: Use the correct API name from state file
-            state_api_name = api_name_mapping.get(api_key, api_key)
+        # FIXED: Use the correct API name from state file
+        for api_key, state_api_name in _METHOD_API_KEYS.get(method, ()):
             last_check = self._get_last_check_time(state_api_name)  # Look for "GitHub" not "github"
             
             if last_check and not force_full:
@@ -386,37 +795,46 @@ class IncrementalDiscoverySystem:
         
         return params
     
-    def _run_incremental_api_discovery(self, config: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
+    def _run_incremental_api_discovery(self, config: DiscoveryConfig, params: Dict[str, Any]) -> Dict[str, Any]:
         """Run API discovery with incremental parameters"""
         
         # Skip if this is a directories-only method
-        if config.get("directories_only", False):
+        if config.directories_only:
+            return {"total_saved": 0, "total_skipped": 0, "api_results": {}}
+        
+        api_method, incremental = self._resolved_methods.get(config.method, (None, False))
+        if api_method is None:
+            logger.error(f"❌ Error in incremental API discovery: no method {config.method}")
             return {"total_saved": 0, "total_skipped": 0, "api_results": {}}
         
         try:
-            # Try to get the incremental method first
-            incremental_method_name = config["method"]
-            if hasattr(unified_apis_service, incremental_method_name):
-                api_method = getattr(unified_apis_service, incremental_method_name)
+            if incremental:
                 return api_method(
-                    target_tools=config["target"],
+                    target_tools=config.target,
                     incremental_params=params
                 )
-            else:
-                # Fallback to regular method with filtering
-                logger.warning(f"⚠️ Incremental method {incremental_method_name} not found, using regular method")
-                regular_method_name = config["method"].replace("_incremental", "")
-                api_method = getattr(unified_apis_service, regular_method_name)
-                result = api_method(target_tools=config["target"])
-                
-                # Post-process to simulate incremental behavior
-                result = self._filter_existing_tools(result, params)
-                return result
+            
+            # Fallback to regular method with filtering
+            logger.warning(f"⚠️ Incremental method {config.method} not found, using regular method")
+            result = api_method(target_tools=config.target)
+            
+            # Post-process to simulate incremental behavior
+            result = self._filter_existing_tools(result, params)
+            return result
                 
         except Exception as e:
             logger.error(f"❌ Error in incremental API discovery: {e}")
             return {"total_saved": 0, "total_skipped": 0, "api_results": {}}
     
+    @staticmethod
+    def _resolve_api_method(config: DiscoveryConfig) -> Tuple[Optional[Callable], bool]:
+        """Look up the API service method for a config: (callable, is_incremental)"""
+        api_method = getattr(unified_apis_service, config.method, None)
+        if api_method is not None:
+            return api_method, True
+        regular_method_name = config.method.replace("_incremental", "")
+        return getattr(unified_apis_service, regular_method_name, None), False
+    
     def _filter_existing_tools(self, result: Dict[str, Any], params: Dict[str, Any]) -> Dict[str, Any]:
         """Filter out tools that haven't been updated since last check"""
         
@@ -429,29 +847,28 @@ class IncrementalDiscoverySystem:
         db = SessionLocal()
         try:
             total_found = result.get("total_saved", 0)
-            skipped_count = 0
             
             # Get tools that were just discovered and check if they're actually new/updated
-            recent_cutoff = datetime.utcnow() - timedelta(minutes=5)  # Just discovered
+            new_tool_ids = result.get("new_tool_ids")
+            if new_tool_ids is not None:
+                # Exactly the rows this discovery call inserted (primary-key lookup, no time window)
+                just_saved = DiscoveredTool.id.in_(new_tool_ids)
+            else:
+                # Service didn't report ids - fall back to "created in the last 5 minutes"
+                just_saved = DiscoveredTool.created_at >= datetime.utcnow() - timedelta(minutes=5)
             
-            recent_tools = db.query(DiscoveredTool).filter(
-                DiscoveredTool.created_at >= recent_cutoff
-            ).all()
+            recent_keys = db.query(DiscoveredTool.name, DiscoveredTool.website).filter(just_saved).all()
             
-            for tool in recent_tools:
-                # Check if this tool existed before and hasn't been meaningfully updated
-                existing = db.query(DiscoveredTool).filter(
-                    and_(
-                        DiscoveredTool.name == tool.name,
-                        DiscoveredTool.website == tool.website,
-                        DiscoveredTool.id != tool.id,
-                        DiscoveredTool.created_at < recent_cutoff
-                    )
-                ).first()
-                
-                if existing:
-                    # Tool already exists and likely hasn't changed
-                    skipped_count += 1
+            # Tools that existed before this run - one query for all keys instead of one per tool
+            existing = set()
+            if recent_keys:
+                existing = set(db.query(DiscoveredTool.name, DiscoveredTool.website).filter(
+                    tuple_(DiscoveredTool.name, DiscoveredTool.website).in_(recent_keys),
+                    ~just_saved
+                ).distinct())
+            
+            # Tool already exists and likely hasn't changed
+            skipped_count = sum(1 for key in recent_keys if tuple(key) in existing)
             
             result["total_skipped"] = skipped_count
             result["total_saved"] = max(0, total_found - skipped_count)
@@ -466,6 +883,7 @@ class IncrementalDiscoverySystem:
     
     def _score_tools_needing_update_fixed(self, force_full: bool, limit: int = 50) -> int:
         """FIXED: Score tools that need activity score updates with proper dead website handling"""
+        self._ensure_services()
         
         if not ACTIVITY_SCORING_AVAILABLE:
             return 0
@@ -479,10 +897,13 @@ class IncrementalDiscoverySystem:
             
             if force_full:
                 # FIXED: Better query that avoids recently failed dead websites
-                score_cutoff = current_time - timedelta(days=7)
-                dead_site_retry_cutoff = current_time - timedelta(days=3)  # Don't retry dead sites for 3 days
+                score_cutoff = current_time - _RESCORE_AFTER
+                dead_status = or_(
+                    DiscoveredTool.website_status == 0,
+                    DiscoveredTool.website_status >= 400
+                )
                 
-                tools_to_score = db.query(DiscoveredTool).filter(
+                tools_to_score = db.query(*_scoring_columns()).filter(
                     and_(
                         # Has a website to check
                         DiscoveredTool.website.isnot(None),
@@ -492,23 +913,24 @@ class IncrementalDiscoverySystem:
                             # Never scored
                             DiscoveredTool.activity_score.is_(None),
                             DiscoveredTool.last_activity_check.is_(None),
-                            # Old score but smart retry logic
+                            # Old score on a working or never-checked site (retry normally)
                             and_(
                                 DiscoveredTool.last_activity_check < score_cutoff,
                                 or_(
-                                    # Working sites (retry normally)
                                     DiscoveredTool.website_status == 200,
-                                    # Dead sites (only retry after 3 days)
-                                    and_(
-                                        or_(
-                                            DiscoveredTool.website_status == 0,
-                                            DiscoveredTool.website_status >= 400
-                                        ),
-                                        DiscoveredTool.last_activity_check < dead_site_retry_cutoff
-                                    ),
-                                    # Never checked sites
                                     DiscoveredTool.website_status.is_(None)
                                 )
+                            ),
+                            # Dead sites only once their backoff cooldown has run out
+                            and_(
+                                dead_status,
+                                or_(
+                                    DiscoveredTool.cooldown_until < current_time,
+                                    and_(
+                                        DiscoveredTool.cooldown_until.is_(None),
+                                        DiscoveredTool.last_activity_check < score_cutoff
+                                    )
+                                )
                             )
                         )
                     )
@@ -516,131 +938,192 @@ class IncrementalDiscoverySystem:
                     # FIXED: Prioritize tools likely to succeed
                     DiscoveredTool.website_status.desc().nulls_last(),  # Working sites first
                     DiscoveredTool.created_at.desc()  # Newer tools first
-                ).limit(limit).all()
+                )
                 
-                logger.info(f"📋 Full scan: Found {len(tools_to_score)} tools needing score updates")
+                logger.info(f"📋 Full scan: Scoring up to {limit} tools needing score updates")
                 
             else:
                 # Incremental: only score new tools and high-priority refreshes
                 recent_cutoff = current_time - timedelta(hours=2)  # Recently discovered
                 stale_cutoff = current_time - timedelta(days=3)   # Scores getting stale
                 
-                tools_to_score = db.query(DiscoveredTool).filter(
+                # One narrow query per branch instead of an OR, so each can use its partial index
+                has_website = and_(
+                    DiscoveredTool.website.isnot(None),
+                    DiscoveredTool.website != ""
+                )
+                candidates = db.query(*_scoring_columns())
+                
+                # New tools without scores
+                new_tools = candidates.filter(
+                    DiscoveredTool.created_at >= recent_cutoff,
+                    DiscoveredTool.activity_score.is_(None),
+                    has_website
+                )
+                # Working tools with stale scores (avoid recently failed dead sites)
+                stale_tools = candidates.filter(
+                    DiscoveredTool.last_activity_check < stale_cutoff,
+                    DiscoveredTool.activity_score.isnot(None),
                     or_(
-                        # New tools without scores
-                        and_(
-                            DiscoveredTool.created_at >= recent_cutoff,
-                            DiscoveredTool.activity_score.is_(None)
-                        ),
-                        # Working tools with stale scores (avoid recently failed dead sites)
-                        and_(
-                            DiscoveredTool.last_activity_check < stale_cutoff,
-                            or_(
-                                DiscoveredTool.website_status == 200,  # Only retry working sites frequently
-                                DiscoveredTool.website_status.is_(None)  # Never checked
-                            )
-                        )
-                    )
-                ).filter(
-                    and_(
-                        DiscoveredTool.website.isnot(None),
-                        DiscoveredTool.website != ""
-                    )
-                ).limit(limit).all()
+                        DiscoveredTool.website_status == 200,  # Only retry working sites frequently
+                        DiscoveredTool.website_status.is_(None)  # Never checked
+                    ),
+                    has_website
+                )
                 
-                logger.info(f"📋 Incremental: Found {len(tools_to_score)} tools needing score updates")
+                # Branches are disjoint on activity_score, so UNION ALL needs no de-duplication
+                tools_to_score = new_tools.union_all(stale_tools)
+                
+                logger.info(f"📋 Incremental: Scoring up to {limit} tools needing score updates")
             
-            if not tools_to_score:
-                logger.info("✅ All tools have up-to-date activity scores")
-                return 0
+            # Hosts that were unreachable and are still cooling down - their other tools skip the network
+            dead_hosts = self._load_dead_hosts(db, current_time)
             
             scored_count = 0
+            total_tools = 0
+            skipped_count = 0
+            # Rows left unchanged this sweep (host cooling down, assessment error) would match again
+            passed_over = set()
             
-            # FIXED: Score each tool and handle failures properly
-            for i, tool in enumerate(tools_to_score):
-                try:
-                    is_new = tool.activity_score is None
-                    action = "Scoring" if is_new else "Updating"
-                    logger.info(f"  ⚡ {action} {i+1}/{len(tools_to_score)}: {tool.name}")
-                    
-                    # Use unified activity service to assess the tool
-                    assessment = unified_activity_service.sync_assess_single_tool(tool)
-                    
-                    # FIXED: Update tool whether assessment succeeds OR fails
-                    if assessment:
-                        # Always update these fields (even for failed assessments)
-                        tool.tool_type_detected = assessment.get('tool_type_detected', 'unknown')
-                        tool.activity_score = assessment.get('activity_score', 0.0)  # Will be 0.0 for dead sites
-                        tool.last_activity_check = current_time
+            while total_tools + skipped_count < limit:
+                # Re-query each batch: rows scored and committed by earlier batches no longer match,
+                # so no offset is needed and an interrupted sweep resumes where it stopped
+                pending = tools_to_score
+                if passed_over:
+                    pending = pending.filter(DiscoveredTool.id.notin_(passed_over))
+                batch = pending.limit(min(_SCORING_CHUNK, limit - total_tools - skipped_count)).all()
+                if not batch:
+                    break
+                
+                # Tools on a host that is cooling down wait for it without a probe. A tool that is itself
+                # dead was only selected because its own cooldown ran out, so it always gets probed
+                skipped = [
+                    tool for tool in batch
+                    if dead_hosts
+                    and not _is_dead_status(tool.website_status)
+                    and _dead_host_for(tool.website) in dead_hosts
+                ]
+                if skipped:
+                    skipped_ids = {tool.id for tool in skipped}
+                    passed_over.update(skipped_ids)
+                    skipped_count += len(skipped)
+                    batch = [tool for tool in batch if tool.id not in skipped_ids]
+                
+                # Assess the batch concurrently on one event loop (network only - no DB access)
+                assessments = asyncio.run(self._assess_batch_async(batch))
+                
+                # FIXED: Score each tool and handle failures properly (DB writes stay on this thread)
+                updates = []
+                newly_dead = set()
+                newly_live = set()
+                for tool, (assessment, assess_error) in zip(batch, assessments):
+                    total_tools += 1
+                    try:
+                        if assess_error is not None:
+                            raise assess_error
                         
-                        # Update status fields (even for failures)
-                        if 'website_status' in assessment:
-                            tool.website_status = assessment.get('website_status', 0)  # 0 for dead sites
-                            
-                        if 'is_actively_maintained' in assessment:
-                            tool.is_actively_maintained = assessment.get('is_actively_maintained', False)
+                        is_new = tool.activity_score is None
+                        action = "Scoring" if is_new else "Updating"
+                        logger.info(_LOG_SCORING, action, total_tools, tool.name)
+                        
+                        # Column values for this tool's row, written in bulk once the batch is done
+                        row = {"id": tool.id, "last_activity_check": current_time}
                         
-                        # Only update source-specific metrics if assessment succeeded
-                        if not assessment.get('error'):
-                            # GitHub metrics
-                            if 'github_stars' in assessment:
-                                tool.github_stars = assessment.get('github_stars')
-                                tool.github_last_commit = assessment.get('github_last_commit')
-                                tool.github_contributors = assessment.get('github_contributors')
+                        # FIXED: Update tool whether assessment succeeds OR fails
+                        if assessment:
+                            # Always update these fields (even for failed assessments)
+                            row["tool_type_detected"] = assessment.get('tool_type_detected', 'unknown')
+                            row["activity_score"] = assessment.get('activity_score', 0.0)  # Will be 0.0 for dead sites
+                            
+                            # Update status fields (even for failures)
+                            if 'website_status' in assessment:
+                                row["website_status"] = assessment.get('website_status', 0)  # 0 for dead sites
+                            
+                            if 'is_actively_maintained' in assessment:
+                                row["is_actively_maintained"] = assessment.get('is_actively_maintained', False)
+                            
+                            # Only update source-specific metrics if assessment succeeded
+                            if not assessment.get('error'):
+                                # GitHub metrics
+                                if 'github_stars' in assessment:
+                                    row["github_stars"] = assessment.get('github_stars')
+                                    row["github_last_commit"] = assessment.get('github_last_commit')
+                                    row["github_contributors"] = assessment.get('github_contributors')
                                 
-                            # NPM metrics
-                            if 'npm_weekly_downloads' in assessment:
-                                tool.npm_weekly_downloads = assessment.get('npm_weekly_downloads')
-                                tool.npm_last_update = assessment.get('npm_last_update')
+                                # NPM metrics
+                                if 'npm_weekly_downloads' in assessment:
+                                    row["npm_weekly_downloads"] = assessment.get('npm_weekly_downloads')
+                                    row["npm_last_update"] = assessment.get('npm_last_update')
                                 
-                            # PyPI metrics
-                            if 'pypi_last_release' in assessment:
-                                tool.pypi_last_release = assessment.get('pypi_last_release')
-                        
-                        # Calculate quality scores
-                        self._calculate_quality_scores(tool, assessment)
-                        
-                        scored_count += 1
-                        
-                        # FIXED: Better logging for both success and failure
-                        score = assessment.get('activity_score', 0)
-                        tool_type = assessment.get('tool_type_detected', 'unknown')
-                        
-                        if assessment.get('error'):
-                            error = assessment.get('error', 'Unknown error')
-                            status = "FAILED"
-                            logger.info(f"    ❌ {status} | Score: {score:.2f} | Error: {error[:50]}...")
-                            # ↑ Tool still gets updated with score 0.0 and appropriate website_status
-                        else:
-                            status = "NEW" if is_new else "UPDATED"
-                            logger.info(f"    ✅ {status} | Score: {score:.2f} | Type: {tool_type}")
+                                # PyPI metrics
+                                if 'pypi_last_release' in assessment:
+                                    row["pypi_last_release"] = assessment.get('pypi_last_release')
                             
-                    else:
-                        # Complete assessment failure - still mark tool as checked
-                        tool.last_activity_check = current_time
-                        tool.activity_score = 0.0
-                        tool.website_status = 0
-                        tool.is_actively_maintained = False
+                            # Calculate quality scores
+                            self._calculate_quality_scores(tool, row, assessment)
+                            
+                            # FIXED: Better logging for both success and failure
+                            score = assessment.get('activity_score', 0)
+                            tool_type = assessment.get('tool_type_detected', 'unknown')
+                            
+                            if assessment.get('error'):
+                                error = assessment.get('error', 'Unknown error')
+                                logger.info(_LOG_SCORE_FAILED, score, error)
+                                # ↑ Tool still gets updated with score 0.0 and appropriate website_status
+                            else:
+                                status = "NEW" if is_new else "UPDATED"
+                                logger.info(_LOG_SCORE_OK, status, score, tool_type)
+                            
+                        else:
+                            # Complete assessment failure - still mark tool as checked. Nothing was learned
+                            # about the site, so its status and failure streak stay as they were
+                            row["activity_score"] = 0.0
+                            row["is_actively_maintained"] = False
+                            logger.info(_LOG_ASSESSMENT_FAILED)
+                            passed_over.add(tool.id)
+                            updates.append(row)
+                            scored_count += 1
+                            continue
+                        
+                        self._apply_site_health(tool, row, current_time)
+                        updates.append(row)
                         scored_count += 1
-                        logger.info(f"    💥 ASSESSMENT FAILED | Score: 0.00 | Marked as dead")
+                        if assessment.get("website_status") == 0:
+                            # The probe itself could not connect - spare the host's other tools
+                            newly_dead.add(_dead_host_for(tool.website))
+                        elif assessment.get("website_status") == 200:
+                            # A live answer clears the host for its remaining tools
+                            newly_live.add(_dead_host_for(tool.website))
                     
-                    # Small delay to be respectful to APIs
-                    time.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"    ❌ Error scoring {tool.name}: {e}")
-                    # Even on exception, mark tool as checked to avoid infinite retries
-                    try:
-                        tool.last_activity_check = current_time
-                        tool.activity_score = 0.0
-                        tool.website_status = 0
-                    except:
-                        pass
-                    continue
+                    except Exception as e:
+                        logger.error(_LOG_SCORE_ERROR, tool.name, e)
+                        # Even on exception, mark tool as checked to avoid infinite retries
+                        # (not a probe result, so the site's status and failure streak are left alone)
+                        row = {
+                            "id": tool.id,
+                            "last_activity_check": current_time,
+                            "activity_score": 0.0,
+                        }
+                        passed_over.add(tool.id)
+                        updates.append(row)
+                
+                # Write the finished batch as bulk UPDATEs (rows are plain tuples - nothing to track)
+                # and commit it, so progress survives a crash later in the sweep
+                db.bulk_update_mappings(DiscoveredTool, updates)
+                db.commit()
+                # Hosts that just failed to connect spare the tools behind them in later batches
+                dead_hosts.difference_update(newly_live)
+                dead_hosts.update(newly_dead)
+                dead_hosts.discard(None)
             
-            # Commit all changes
-            db.commit()
-            logger.info(f"✅ Successfully scored {scored_count}/{len(tools_to_score)} tools")
+            if skipped_count:
+                logger.info("⏭️ Left %d tools on cooling-down hosts for a later run", skipped_count)
+            
+            if not total_tools:
+                logger.info("✅ All tools have up-to-date activity scores")
+                return 0
+            
+            logger.info("✅ Successfully scored %d/%d tools", scored_count, total_tools)
             return scored_count
             
         except Exception as e:
@@ -650,41 +1133,94 @@ class IncrementalDiscoverySystem:
         finally:
             db.close()
     
-    def _calculate_quality_scores(self, tool: DiscoveredTool, assessment: dict):
-        """Calculate additional quality scores"""
+    @staticmethod
+    def _load_dead_hosts(db, now: datetime) -> set:
+        """Hosts of sites that failed to connect and are still on cooldown"""
+        websites = db.query(DiscoveredTool.website).filter(
+            DiscoveredTool.website_status == 0,
+            DiscoveredTool.cooldown_until > now
+        ).distinct()
+        hosts = {_dead_host_for(website) for website, in websites}
+        hosts.discard(None)
+        return hosts
+    
+    async def _assess_batch_async(self, tools: list) -> list:
+        """Assess a batch over one shared session; returns (assessment, error) per tool, in order"""
+        sem = asyncio.Semaphore(_SCORING_CONCURRENCY)
+        
+        async def assess(tool):
+            # Reuse a recent assessment of the same URL (tools are often listed under several sources)
+            key = _probe_key(tool.website)
+            assessment = self.probe_cache.get(key)
+            if assessment is not None:
+                return assessment, None
+            
+            # Be respectful to APIs - only waits when this host was hit recently. The wait happens
+            # before taking a concurrency slot, so a throttled host never blocks the other hosts
+            await asyncio.sleep(self.rate_limiter.reserve(HostRateLimiter.host_for(tool.website)))
+            async with sem:
+                try:
+                    assessment = await unified_activity_service.assess_tool_activity(tool)
+                except Exception as e:
+                    return None, e
+            if assessment:
+                self.probe_cache.set(key, assessment)
+            return assessment, None
+        
+        async with unified_activity_service.batch_session():
+            return await asyncio.gather(*(assess(tool) for tool in tools))
+    
+    @staticmethod
+    def _apply_site_health(tool, row: Dict[str, Any], now: datetime):
+        """Back a dead site off exponentially; any live probe clears its failure streak"""
+        if _is_dead_status(row.get("website_status", tool.website_status)):
+            failures = (tool.consecutive_failures or 0) + 1
+            row["consecutive_failures"] = failures
+            row["cooldown_until"] = now + HEALTH_POLICY.cooldown(failures)
+        else:
+            row["consecutive_failures"] = 0
+            row["cooldown_until"] = None
+    
+    def _calculate_quality_scores(self, tool: "DiscoveredTool", row: Dict[str, Any], assessment: dict):
+        """Add the derived quality scores to a tool's pending row (row values win over the loaded tool)"""
         
-        # Community size score (based on stars, downloads, etc.)
-        community_score = 0.0
-        if tool.github_stars:
-            community_score = min(tool.github_stars / 1000, 1.0) * 0.6
-        if tool.npm_weekly_downloads:
-            community_score += min(tool.npm_weekly_downloads / 10000, 1.0) * 0.4
-        tool.community_size_score = community_score
+        # Community size score (based on stars, downloads, etc.) - each source saturates at its cap
+        stars = min(row.get("github_stars", tool.github_stars) or 0, _STARS_CAP)
+        downloads = min(row.get("npm_weekly_downloads", tool.npm_weekly_downloads) or 0, _DOWNLOADS_CAP)
+        row["community_size_score"] = stars * _STARS_WEIGHT + downloads * _DOWNLOADS_WEIGHT
         
         # Usage popularity score
-        tool.usage_popularity_score = assessment.get('activity_score', 0.0)
-        
-        # Maintenance quality score
-        maintenance_score = 0.5  # Base score
-        if tool.is_actively_maintained:
-            maintenance_score += 0.3
-        if tool.website_status == 200:
-            maintenance_score += 0.2
-        tool.maintenance_quality_score = min(maintenance_score, 1.0)
+        row["usage_popularity_score"] = assessment.get('activity_score', 0.0)
+        
+        # Maintenance quality score: 0.5 base + 0.3 maintained + 0.2 live site (max 1.0)
+        maintained = row.get("is_actively_maintained", tool.is_actively_maintained)
+        website_status = row.get("website_status", tool.website_status)
+        row["maintenance_quality_score"] = 0.5 + 0.3 * bool(maintained) + 0.2 * (website_status == 200)
     
     def _show_scored_tools_sample(self, limit: int = 5):
         """Show a sample of recently scored tools"""
+        self._ensure_services()
+        
+        # Purely informational - skip the query entirely when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
         logger.info(f"\n📊 SAMPLE OF SCORED TOOLS:")
         
         db = SessionLocal()
         try:
-            recent_scored = db.query(DiscoveredTool).filter(
+            recent_scored = db.query(
+                DiscoveredTool.name,
+                DiscoveredTool.activity_score,
+                DiscoveredTool.tool_type_detected,
+                DiscoveredTool.github_stars,
+                DiscoveredTool.npm_weekly_downloads,
+            ).filter(
                 and_(
                     DiscoveredTool.activity_score.isnot(None),
                     DiscoveredTool.last_activity_check >= datetime.utcnow() - timedelta(minutes=30)
                 )
-            ).order_by(DiscoveredTool.activity_score.desc()).limit(limit).all()
+            ).order_by(DiscoveredTool.activity_score.desc()).limit(limit)
             
             for tool in recent_scored:
                 score = tool.activity_score or 0
@@ -692,7 +1228,7 @@ class IncrementalDiscoverySystem:
                 stars = f" | {tool.github_stars} ⭐" if tool.github_stars else ""
                 downloads = f" | {tool.npm_weekly_downloads} 📦/week" if tool.npm_weekly_downloads else ""
                 
-                logger.info(f"  🎯 {tool.name}: {score:.2f} ({tool_type}){stars}{downloads}")
+                logger.info(_LOG_SAMPLE, tool.name, score, tool_type, stars, downloads)
                 
         except Exception as e:
             logger.error(f"Error showing sample: {e}")
@@ -705,74 +1241,103 @@ class IncrementalDiscoverySystem:
     
     def show_dead_websites(self):
         """Show current dead websites and their retry status"""
+        self._ensure_services()
         
         if not ACTIVITY_SCORING_AVAILABLE:
             logger.error("❌ Activity scoring not available")
             return
         
+        # Report only - skip the queries and formatting when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
         logger.info("💀 DEAD WEBSITES ANALYSIS")
         logger.info("=" * 60)
         
         db = SessionLocal()
         try:
             current_time = datetime.utcnow()
-            dead_site_retry_cutoff = current_time - timedelta(days=3)
             
-            # Get dead websites
-            dead_sites = db.query(DiscoveredTool).filter(
+            # Dead websites, split by retry status in SQL - only counts and the sample rows come back
+            legacy_cutoff = current_time - _RESCORE_AFTER
+            is_dead = _dead_site_filter()
+            # Rows without a cooldown yet fall back to the normal rescore window
+            is_ready = or_(
+                DiscoveredTool.cooldown_until <= current_time,
                 and_(
-                    or_(
-                        DiscoveredTool.website_status == 0,
-                        DiscoveredTool.website_status >= 400
-                    ),
-                    DiscoveredTool.activity_score == 0.0,
-                    DiscoveredTool.last_activity_check.isnot(None)
+                    DiscoveredTool.cooldown_until.is_(None),
+                    DiscoveredTool.last_activity_check <= legacy_cutoff
                 )
-            ).order_by(DiscoveredTool.last_activity_check.desc()).all()
+            )
+            # Spelled out rather than ~is_ready, which would be NULL for rows without a cooldown
+            is_cooling_down = or_(
+                DiscoveredTool.cooldown_until > current_time,
+                and_(
+                    DiscoveredTool.cooldown_until.is_(None),
+                    DiscoveredTool.last_activity_check > legacy_cutoff
+                )
+            )
+            
+            total_dead, ready_count, next_cooldown_end, next_legacy_check = db.query(
+                func.count(),
+                func.coalesce(func.sum(case((is_ready, 1), else_=0)), 0),
+                func.min(case((DiscoveredTool.cooldown_until > current_time, DiscoveredTool.cooldown_until))),
+                func.min(case((
+                    and_(DiscoveredTool.cooldown_until.is_(None), DiscoveredTool.last_activity_check > legacy_cutoff),
+                    DiscoveredTool.last_activity_check
+                ))),
+            ).filter(is_dead).one()
             
-            if not dead_sites:
+            if not total_dead:
                 logger.info("✅ No dead websites found!")
                 return
             
-            # Categorize by retry status
-            ready_for_retry = []
-            on_cooldown = []
+            cooldown_count = total_dead - ready_count
             
-            for site in dead_sites:
-                if site.last_activity_check < dead_site_retry_cutoff:
-                    ready_for_retry.append(site)
-                else:
-                    on_cooldown.append(site)
+            def sample(condition, limit):
+                """Sample rows for one bucket - iterated straight off the cursor"""
+                return db.query(
+                    DiscoveredTool.name,
+                    DiscoveredTool.website_status,
+                    DiscoveredTool.last_activity_check,
+                    DiscoveredTool.cooldown_until,
+                    DiscoveredTool.consecutive_failures,
+                ).filter(is_dead, condition).order_by(
+                    DiscoveredTool.last_activity_check.desc()
+                ).limit(limit)
             
             logger.info(f"📊 SUMMARY:")
-            logger.info(f"   • Total dead websites: {len(dead_sites)}")
-            logger.info(f"   • Ready for retry (>3 days): {len(ready_for_retry)}")
-            logger.info(f"   • On cooldown (<3 days): {len(on_cooldown)}")
+            logger.info(f"   • Total dead websites: {total_dead}")
+            logger.info(f"   • Ready for retry (cooldown over): {ready_count}")
+            logger.info(f"   • On cooldown: {cooldown_count}")
             
-            if ready_for_retry:
-                logger.info(f"\n🔄 READY FOR RETRY ({len(ready_for_retry)} sites):")
-                for i, site in enumerate(ready_for_retry[:10], 1):
+            if ready_count:
+                logger.info(f"\n🔄 READY FOR RETRY ({ready_count} sites):")
+                for i, site in enumerate(sample(is_ready, 10), 1):
                     days_since = (current_time - site.last_activity_check).days
-                    logger.info(f"  {i:2d}. {site.name[:40]:<40} | Status: {site.website_status} | {days_since}d ago")
-                if len(ready_for_retry) > 10:
-                    logger.info(f"      ... and {len(ready_for_retry) - 10} more")
+                    logger.info(_LOG_DEAD_READY, i, site.name, site.website_status, days_since, site.consecutive_failures or 0)
+                if ready_count > 10:
+                    logger.info(f"      ... and {ready_count - 10} more")
             
-            if on_cooldown:
-                logger.info(f"\n❄️ ON COOLDOWN ({len(on_cooldown)} sites):")
-                for i, site in enumerate(on_cooldown[:5], 1):
-                    hours_since = (current_time - site.last_activity_check).total_seconds() / 3600
-                    remaining_hours = max(0, 72 - hours_since)  # 72h = 3 days
-                    logger.info(f"  {i:2d}. {site.name[:40]:<40} | Status: {site.website_status} | {remaining_hours:.1f}h left")
-                if len(on_cooldown) > 5:
-                    logger.info(f"      ... and {len(on_cooldown) - 5} more")
+            if cooldown_count:
+                logger.info(f"\n❄️ ON COOLDOWN ({cooldown_count} sites):")
+                for i, site in enumerate(sample(is_cooling_down, 5), 1):
+                    retry_at = site.cooldown_until or site.last_activity_check + _RESCORE_AFTER
+                    remaining_hours = (retry_at - current_time).total_seconds() / 3600
+                    logger.info(_LOG_DEAD_COOLDOWN, i, site.name, site.website_status, remaining_hours)
+                if cooldown_count > 5:
+                    logger.info(f"      ... and {cooldown_count - 5} more")
             
             logger.info(f"\n💡 NEXT ACTIONS:")
-            if ready_for_retry:
-                logger.info(f"   • {len(ready_for_retry)} sites ready for retry")
+            if ready_count:
+                logger.info(f"   • {ready_count} sites ready for retry")
                 logger.info(f"   • Run: python intelligent_discovery.py run-once enhanced_all --force-full")
-            if on_cooldown:
-                min_remaining = min((72 - (current_time - site.last_activity_check).total_seconds() / 3600) for site in on_cooldown)
-                logger.info(f"   • {len(on_cooldown)} sites on cooldown")
+            if cooldown_count:
+                next_retry = min(
+                    t for t in (next_cooldown_end, next_legacy_check and next_legacy_check + _RESCORE_AFTER) if t
+                )
+                min_remaining = (next_retry - current_time).total_seconds() / 3600
+                logger.info(f"   • {cooldown_count} sites on cooldown")
                 logger.info(f"   • Next retry available in: {min_remaining:.1f} hours")
             
             logger.info(f"\n🛠️ MANAGEMENT COMMANDS:")
@@ -787,6 +1352,7 @@ class IncrementalDiscoverySystem:
     
     def reset_dead_websites(self):
         """Reset all dead websites to allow immediate retry (for testing)"""
+        self._ensure_services()
         
         if not ACTIVITY_SCORING_AVAILABLE:
             logger.error("❌ Activity scoring not available")
@@ -797,33 +1363,22 @@ class IncrementalDiscoverySystem:
         
         db = SessionLocal()
         try:
-            # Find dead websites
-            dead_sites = db.query(DiscoveredTool).filter(
-                and_(
-                    or_(
-                        DiscoveredTool.website_status == 0,
-                        DiscoveredTool.website_status >= 400
-                    ),
-                    DiscoveredTool.activity_score == 0.0,
-                    DiscoveredTool.last_activity_check.isnot(None)
-                )
-            ).all()
+            # Reset their last_activity_check to force retry - one UPDATE, no rows loaded
+            old_cutoff = datetime.utcnow() - timedelta(days=10)  # 10 days ago
             
-            if not dead_sites:
+            reset_count = db.query(DiscoveredTool).filter(_dead_site_filter()).update({
+                DiscoveredTool.last_activity_check: old_cutoff,
+                DiscoveredTool.cooldown_until: None,
+                DiscoveredTool.consecutive_failures: 0,
+            }, synchronize_session=False)
+            
+            if not reset_count:
                 logger.info("✅ No dead websites found to reset")
                 return
             
-            logger.info(f"📋 Found {len(dead_sites)} dead websites to reset")
-            
-            # Reset their last_activity_check to force retry
-            old_cutoff = datetime.utcnow() - timedelta(days=10)  # 10 days ago
-            
-            for site in dead_sites:
-                site.last_activity_check = old_cutoff
-            
             db.commit()
             
-            logger.info(f"✅ Successfully reset {len(dead_sites)} dead websites")
+            logger.info(f"✅ Successfully reset {reset_count} dead websites")
             logger.info(f"🎯 These sites will now be retried on next discovery run")
             logger.info(f"📝 Run: python intelligent_discovery.py run-once enhanced_all --force-full")
             
@@ -854,37 +1409,47 @@ class IncrementalDiscoverySystem:
     
     def show_state(self):
         """Show current state information"""
-        logger.info("📊 Discovery System State:")
-        logger.info(f"  • Total runs: {self.state.get('total_runs', 0)}")
-        logger.info(f"  • Last full scan: {self.state.get('last_full_scan', 'Never')}")
-        logger.info(f"  • Force full scan after: {self.state.get('force_full_scan_after_days', 7)} days")
+        # Report only - skip all the formatting when INFO is filtered out
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        last_full_scan = self.state.get("last_full_scan")
+        lines = [
+            "📊 Discovery System State:",
+            f"  • Total runs: {self.state.get('total_runs', 0)}",
+            f"  • Last full scan: {_from_epoch(last_full_scan).strftime('%Y-%m-%d %H:%M') + ' UTC' if last_full_scan else 'Never'}",
+            f"  • Force full scan after: {self.state.get('force_full_scan_after_days', 7)} days",
+            "\n📅 API Last Check Times:",
+        ]
         
-        logger.info("\n📅 API Last Check Times:")
         api_checks = self.state.get("api_last_checks", {})
         if api_checks:
+            now = time.time()
             for api, timestamp in api_checks.items():
                 try:
-                    check_time = datetime.fromisoformat(timestamp)
-                    hours_ago = (datetime.utcnow() - check_time).total_seconds() / 3600
-                    logger.info(f"  • {api}: {check_time.strftime('%Y-%m-%d %H:%M')} UTC ({hours_ago:.1f}h ago)")
-                except:
-                    logger.info(f"  • {api}: {timestamp}")
+                    check_time = _from_epoch(timestamp)
+                    hours_ago = (now - timestamp) / 3600
+                    lines.append(f"  • {api}: {check_time.strftime('%Y-%m-%d %H:%M')} UTC ({hours_ago:.1f}h ago)")
+                except (TypeError, ValueError, OverflowError, OSError) as e:
+                    lines.append(f"  • {api}: {timestamp!r} (unreadable timestamp: {e})")
         else:
-            logger.info("  (No API checks recorded)")
+            lines.append("  (No API checks recorded)")
         
         # Show if full scan is due
         if self._should_force_full_scan():
-            logger.info("\n🔄 Status: Full scan will be triggered on next run")
+            lines.append("\n🔄 Status: Full scan will be triggered on next run")
         else:
-            logger.info("\n⚡ Status: Incremental mode will be used on next run")
+            lines.append("\n⚡ Status: Incremental mode will be used on next run")
+        
+        logger.info("\n".join(lines))
     
-    def start_continuous(self, method: str = "enhanced_all", interval_hours: int = 6, auto_score: bool = True):
-        """Start continuous incremental discovery"""
+    async def start_continuous(self, method: str = "enhanced_all", interval_hours: int = 6, auto_score: bool = True):
+        """Start continuous incremental discovery (runs each cycle in a daemon thread)"""
         
         config = self.discovery_methods.get(method, self.discovery_methods["enhanced_all"])
         
         logger.info(f"🚀 Starting Incremental Continuous Discovery")
-        logger.info(f"📋 Method: {method} ({config['description']})")
+        logger.info(f"📋 Method: {method} ({config.description})")
         logger.info(f"⏰ Interval: {interval_hours} hours")
         logger.info(f"⚡ Auto Activity Scoring: {'ENABLED' if auto_score else 'DISABLED'}")
         logger.info(f"💡 Workflow: Only check updated tools → Score changes → Ready!")
@@ -892,52 +1457,78 @@ class IncrementalDiscoverySystem:
         # Check API configurations
         self._check_api_configurations()
         
+        interval = interval_hours * 3600
+        # Retries back off up to the normal interval, but never faster than the first retry
+        # (interval_hours=0 would otherwise turn a failing cycle into a tight loop)
+        max_backoff = max(interval, _RETRY_BACKOFF_START)
+        backoff = _RETRY_BACKOFF_START
+        # Cycles are scheduled on a fixed monotonic grid so run time doesn't push later runs back
+        next_tick = time.monotonic()
         while True:
             try:
-                result = self.run_incremental_discovery(method, auto_score)
+                result = await self._run_cycle(method, auto_score)
+                backoff = _RETRY_BACKOFF_START
                 logger.info(f"📊 Session stats: {self.stats['runs']} runs, {self.stats['tools_found']} total new, {self.stats['tools_skipped']} total skipped")
-                logger.info(f"⏳ Waiting {interval_hours} hours until next incremental discovery...")
-                time.sleep(interval_hours * 3600)
-            except KeyboardInterrupt:
-                logger.info("⚠️ Discovery stopped by user")
-                break
+                
+                next_tick += interval
+                now = time.monotonic()
+                if next_tick <= now:
+                    # Overran the interval - start over from now rather than firing back-to-back catch-up runs
+                    logger.warning(f"⚠️ Discovery cycle overran the {interval_hours}h interval - starting next cycle now")
+                    next_tick = now
+                logger.info(f"⏳ Waiting {(next_tick - now) / 3600:.1f} hours until next incremental discovery...")
+                await asyncio.sleep(next_tick - now)
             except Exception as e:
                 logger.error(f"Cycle error: {e}")
-                logger.info("🔄 Retrying in 5 minutes...")
-                time.sleep(300)
+                # Exponential backoff with jitter, clamped to [first retry, normal interval]
+                delay = min(max(backoff * (0.5 + random.random()), _RETRY_BACKOFF_START), max_backoff)
+                backoff = min(backoff * 2, max_backoff)
+                logger.info(f"🔄 Retrying in {delay / 60:.1f} minutes...")
+                await asyncio.sleep(delay)
+                next_tick = time.monotonic()
     
-    def _check_api_configurations(self):
-        """Check which APIs are configured"""
-        logger.info("🔧 API Configuration Status:")
+    async def _run_cycle(self, method: str, auto_score: bool):
+        """Run one discovery cycle in a daemon thread; cancelling the wait (Ctrl-C) abandons the
+        thread instead of blocking shutdown until its network calls finish"""
+        loop = asyncio.get_running_loop()
+        done = loop.create_future()
+        
+        def settle(result, error):
+            if done.cancelled():
+                return
+            if error is None:
+                done.set_result(result)
+            else:
+                done.set_exception(error)
         
-        # Always available
-        logger.info("  ✅ GitHub API: Available (incremental via updated_at)")
-        logger.info("  ✅ NPM Registry API: Available (incremental via modified)")
-        logger.info("  ✅ PyPI JSON API: Available") 
-        logger.info("  ✅ Hacker News API: Available (incremental via timestamp)")
-        logger.info("  ✅ Stack Overflow API: Available (incremental via last_activity_date)")
-        logger.info("  ✅ Reddit API: Available (incremental via created_utc)")
-        
-        # AI Directory Scraping
-        if DIRECTORY_SCRAPING_AVAILABLE:
-            logger.info("  ✅ AI Directory Scraping: Available")
-            logger.info("    • There's An AI For That: Incremental (daily checks)")
-            logger.info("    • AI Tools Directory: Incremental (daily checks)")
-            logger.info("    • Futurepedia: Incremental (daily checks)")
-        else:
-            logger.info("  ❌ AI Directory Scraping: Not available")
+        def cycle():
+            try:
+                outcome = (self.run_incremental_discovery(method, auto_score), None)
+            except Exception as e:
+                outcome = (None, e)
+            try:
+                loop.call_soon_threadsafe(settle, *outcome)
+            except RuntimeError:
+                pass  # Loop already closed - discovery was stopped and nobody waits for this cycle
         
-        # Check activity scoring
-        if ACTIVITY_SCORING_AVAILABLE:
-            logger.info("  ✅ Activity Scoring: Available")
-        else:
-            logger.info("  ❌ Activity Scoring: Not available")
+        threading.Thread(target=cycle, name="discovery-cycle", daemon=True).start()
+        return await done
+    
+    def _check_api_configurations(self):
+        """Check which APIs are configured"""
+        self._ensure_services()
+        if not logger.isEnabledFor(logging.INFO):
+            return
         
-        # Show state file location
-        logger.info(f"💾 State file: {os.path.abspath(self.state_file)}")
+        # Static block plus the state file location, logged as one record
+        logger.info("\n".join((
+            *_api_configuration_lines(),
+            f"💾 State file: {self.state_path}",
+        )))
 
     def test_apis(self):
         """Test individual API connections with incremental support"""
+        self._ensure_services()
         logger.info("🧪 Testing incremental API connections...")
         
         test_methods = [
@@ -955,44 +1546,27 @@ class IncrementalDiscoverySystem:
                 ("Futurepedia", "run_sync_scrape_futurepedia_incremental", 3)
             ])
 
-        results = {}
+        # Probe every API at once - total time is the slowest API, not the sum
+        probed = {}
+        last_check_iso = (datetime.utcnow() - timedelta(hours=1)).isoformat()
+        executor = ThreadPoolExecutor(max_workers=min(16, len(test_methods)))
+        futures = {
+            executor.submit(self._probe_api, api_name, method_name, target, last_check_iso): api_name
+            for api_name, method_name, target in test_methods
+        }
+        try:
+            for future in as_completed(futures, timeout=_API_TEST_TIMEOUT):
+                probed[futures[future]] = future.result()
+        except FuturesTimeoutError:
+            for api_name in futures.values():
+                if api_name not in probed:
+                    probed[api_name] = f"⚠️ Timeout (>{_API_TEST_TIMEOUT}s)"
+                    logger.info(f"    ⚠️ {api_name}: No response within {_API_TEST_TIMEOUT}s")
+        finally:
+            # Don't wait on hung probes
+            executor.shutdown(wait=False, cancel_futures=True)
         
-        for api_name, method_name, target in test_methods:
-            try:
-                logger.info(f"  🔍 Testing {api_name} API (incremental mode)...")
-                
-                # Prepare incremental test parameters
-                test_params = {
-                    "force_full_scan": False,
-                    "last_check_times": {api_name.lower(): (datetime.utcnow() - timedelta(hours=1)).isoformat()},
-                    "incremental_mode": True
-                }
-                
-                # Try incremental method first, fallback to regular if not available
-                service = unified_apis_service
-                if api_name in ["There's An AI For That", "AI Tools Directory", "Futurepedia"]:
-                    service = ai_directory_service
-                
-                if hasattr(service, method_name):
-                    api_method = getattr(service, method_name)
-                    result = api_method(target_tools=target, incremental_params=test_params)
-                else:
-                    logger.info(f"    ⚠️ Incremental method not found, testing regular method")
-                    regular_method = method_name.replace("_incremental", "")
-                    api_method = getattr(service, regular_method)
-                    result = api_method(target_tools=target)
-                
-                if result.get("total_saved", 0) >= 0:  # Even 0 is OK for a test
-                    skipped = result.get("total_skipped", 0)
-                    results[api_name] = f"✅ Working (found: {result.get('total_saved', 0)}, skipped: {skipped})"
-                    logger.info(f"    ✅ {api_name}: Working - incremental support detected")
-                else:
-                    results[api_name] = "⚠️ Issues"
-                    logger.info(f"    ⚠️ {api_name}: Issues detected")
-                    
-            except Exception as e:
-                results[api_name] = f"❌ Failed: {str(e)}"
-                logger.info(f"    ❌ {api_name}: {str(e)}")
+        results = {api_name: probed[api_name] for api_name, _, _ in test_methods}
         
         # Test activity scoring
         if ACTIVITY_SCORING_AVAILABLE:
@@ -1018,192 +1592,208 @@ class IncrementalDiscoverySystem:
         
         return results
     
+    def _probe_api(self, api_name: str, method_name: str, target: int, last_check_iso: str) -> str:
+        """Run one incremental API test call and describe the outcome"""
+        try:
+            logger.info(f"  🔍 Testing {api_name} API (incremental mode)...")
+            
+            # Prepare incremental test parameters
+            test_params = {**_TEST_PARAMS_BASE, "last_check_times": {api_name.lower(): last_check_iso}}
+            
+            # Try incremental method first, fallback to regular if not available
+            service = ai_directory_service if api_name in _AI_DIRECTORY_APIS else unified_apis_service
+            
+            if hasattr(service, method_name):
+                api_method = getattr(service, method_name)
+                result = api_method(target_tools=target, incremental_params=test_params)
+            else:
+                logger.info(f"    ⚠️ Incremental method not found, testing regular method")
+                regular_method = method_name.replace("_incremental", "")
+                api_method = getattr(service, regular_method)
+                result = api_method(target_tools=target)
+            
+            if result.get("total_saved", 0) >= 0:  # Even 0 is OK for a test
+                skipped = result.get("total_skipped", 0)
+                logger.info(f"    ✅ {api_name}: Working - incremental support detected")
+                return f"✅ Working (found: {result.get('total_saved', 0)}, skipped: {skipped})"
+            
+            logger.info(f"    ⚠️ {api_name}: Issues detected")
+            return "⚠️ Issues"
+                
+        except Exception as e:
+            logger.info(f"    ❌ {api_name}: {str(e)}")
+            return f"❌ Failed: {str(e)}"
+    
     def show_status(self):
         """Show incremental discovery system status"""
-        logger.info("📊 Incremental Discovery System Status:")
-        logger.info(f"  • Total runs: {self.stats['runs']}")
-        logger.info(f"  • Total tools found: {self.stats['tools_found']}")
-        logger.info(f"  • Total tools scored: {self.stats['tools_scored']}")
-        logger.info(f"  • Total tools skipped: {self.stats['tools_skipped']}")
+        if not logger.isEnabledFor(logging.INFO):
+            return
+        
+        lines = [
+            "📊 Incremental Discovery System Status:",
+            f"  • Total runs: {self.stats['runs']}",
+            f"  • Total tools found: {self.stats['tools_found']}",
+            f"  • Total tools scored: {self.stats['tools_scored']}",
+            f"  • Total tools skipped: {self.stats['tools_skipped']}",
+        ]
         
         if self.stats['runs'] > 0:
             avg_tools = self.stats['tools_found'] / self.stats['runs']
             avg_scored = self.stats['tools_scored'] / self.stats['runs']
             avg_skipped = self.stats['tools_skipped'] / self.stats['runs']
             
-            logger.info(f"  • Average new tools per run: {avg_tools:.1f}")
-            logger.info(f"  • Average scored per run: {avg_scored:.1f}")
-            logger.info(f"  • Average skipped per run: {avg_skipped:.1f}")
+            lines.append(f"  • Average new tools per run: {avg_tools:.1f}")
+            lines.append(f"  • Average scored per run: {avg_scored:.1f}")
+            lines.append(f"  • Average skipped per run: {avg_skipped:.1f}")
             
             # Calculate efficiency
             total_processed = self.stats['tools_found'] + self.stats['tools_skipped']
             if total_processed > 0:
                 efficiency = (self.stats['tools_skipped'] / total_processed) * 100
-                logger.info(f"  • Efficiency (% skipped): {efficiency:.1f}%")
+                lines.append(f"  • Efficiency (% skipped): {efficiency:.1f}%")
+        
+        logger.info("\n".join(lines))
         
         # Show state information
         self.show_state()
         
-        logger.info("\n🎯 Available Incremental Methods:")
-        for method, config in self.discovery_methods.items():
-            logger.info(f"  • {method}: {config['description']} (target: {config['target']})")
-        
-        logger.info("\n🔧 Incremental Features:")
-        logger.info("  ✅ Per-API last check tracking")
-        logger.info("  ✅ Automatic weekly full scans") 
-        logger.info("  ✅ Smart activity score updates")
-        logger.info("  ✅ Persistent state management")
-        logger.info("  ✅ Efficiency metrics and skip tracking")
-        logger.info("  ✅ AI Directory scraping integration")
-        logger.info("  ✅ Dead website cooldown system")
+        logger.info("\n".join(("\n🎯 Available Incremental Methods:", self.method_status, *_INCREMENTAL_FEATURES)))
+
+
+def _print_usage(system: IncrementalDiscoverySystem):
+    """Print the CLI banner, commands and examples"""
+    print("🧠 Incremental AI Tools Discovery System - FIXED VERSION")
+    print("💡 Only processes UPDATED tools since last run!")
+    print("💀 Smart dead website handling with cooldowns!")
+    print("🤖 Includes AI Directory Scraping!")
+    print("\nUsage:")
+    print("  python intelligent_discovery.py start [method] [interval_hours]")
+    print("  python intelligent_discovery.py run-once [method] [--force-full]")
+    print("  python intelligent_discovery.py state")
+    print("  python intelligent_discovery.py status")
+    print("  python intelligent_discovery.py reset [api_name]")
+    print("  python intelligent_discovery.py show-dead")
+    print("  python intelligent_discovery.py reset-dead")
+    print("  python intelligent_discovery.py setup")
+    print("  python intelligent_discovery.py test")
+    
+    print("\n🎯 Discovery Methods:")
+    print(system.method_help)
+    
+    print("\n⚡ FIXED Features:")
+    print("  • Default: Only check updated tools since last run")
+    print("  • Weekly: Automatic full scan every 7 days")
+    print("  • Force full: Add --force-full flag")
+    print("  • State tracking: Persistent in discovery_state.json")
+    print("  • AI Directories: Daily incremental checks")
+    print("  • Dead sites: 1-day cooldown before retry, doubling per failure up to 7 days")
+    print("  • Realistic counts: No more inflated tool numbers")
+    
+    print("\n📋 Examples:")
+    print("  # Incremental discovery with APIs + directories (recommended)")
+    print("  python intelligent_discovery.py run-once enhanced_all")
+    print("")
+    print("  # Check dead websites and their status")
+    print("  python intelligent_discovery.py show-dead")
+    print("")
+    print("  # Force full scan (ignores incremental state)")
+    print("  python intelligent_discovery.py run-once enhanced_all --force-full")
+    print("")
+    print("  # Reset dead website cooldowns (for testing)")
+    print("  python intelligent_discovery.py reset-dead")
+    print("")
+    print("  # Start continuous incremental discovery every 2 hours") 
+    print("  python intelligent_discovery.py start enhanced_all 2")
+    
+    print("\n💡 FIXED Benefits:")
+    print("  🚀 Much faster runs (only checks updated tools)")
+    print("  💰 Reduced API usage (fewer requests)")
+    print("  ⚡ Smart scoring (only re-score when needed)")
+    print("  📊 State persistence (remembers what was checked)")
+    print("  🔄 Auto full-scan weekly (catches any missed updates)")
+    print("  🤖 AI Directory integration (curated quality tools)")
+    print("  💀 Dead website management (backoff cooldowns, 1 to 7 days)")
+    print("  📏 Realistic tool counts (no more fake inflation)")
+
+
+
+def _cmd_start(system: IncrementalDiscoverySystem, args: argparse.Namespace):
+    # Incremental continuous discovery
+    try:
+        asyncio.run(system.start_continuous(args.method, args.interval_hours, args.auto_score))
+    except KeyboardInterrupt:
+        logger.info("⚠️ Discovery stopped by user")
+
+
+def _cmd_run_once(system: IncrementalDiscoverySystem, args: argparse.Namespace):
+    # Single incremental discovery run
+    result = system.run_incremental_discovery(args.method, args.auto_score, args.force_full)
+    print(f"✅ Incremental discovery complete:")
+    print(f"   📈 Found {result['new_tools']} new tools")
+    print(f"   ⚡ Scored {result['scored_tools']} tools")
+    print(f"   ⏭️ Skipped {result['skipped_tools']} unchanged tools")
+
+
+# Command name -> handler(system, args)
+COMMANDS: Mapping[str, Callable[[IncrementalDiscoverySystem, argparse.Namespace], None]] = MappingProxyType({
+    "start": _cmd_start,
+    "run-once": _cmd_run_once,
+    "state": lambda system, args: system.show_state(),
+    "status": lambda system, args: system.show_status(),
+    "reset": lambda system, args: system.reset_state(args.api_name),
+    "show-dead": lambda system, args: system.show_dead_websites(),
+    "reset-dead": lambda system, args: system.reset_dead_websites(),
+    "test": lambda system, args: system.test_apis(),
+    "setup": lambda system, args: print(_SETUP_TEXT),
+})
+
+
+def _build_parser() -> argparse.ArgumentParser:
+    """Build the argparse CLI (one subcommand per COMMANDS entry)"""
+    parser = argparse.ArgumentParser(
+        prog="intelligent_discovery.py",
+        description="Incremental AI Tools Discovery System"
+    )
+    commands = parser.add_subparsers(dest="command")
+    
+    start = commands.add_parser("start", help="Incremental continuous discovery")
+    start.add_argument("method", nargs="?", default="enhanced_all")
+    start.add_argument("interval_hours", nargs="?", type=int, default=6)
+    start.add_argument("--no-scoring", dest="auto_score", action="store_false")
+    
+    run_once = commands.add_parser("run-once", help="Single incremental discovery run")
+    run_once.add_argument("method", nargs="?", default="enhanced_all")
+    run_once.add_argument("--no-scoring", dest="auto_score", action="store_false")
+    run_once.add_argument("--force-full", action="store_true")
+    
+    reset = commands.add_parser("reset", help="Reset state (all APIs or one)")
+    reset.add_argument("api_name", nargs="?")
+    
+    commands.add_parser("state", help="Show current state")
+    commands.add_parser("status", help="Show comprehensive status")
+    commands.add_parser("show-dead", help="Show dead websites and their retry status")
+    commands.add_parser("reset-dead", help="Reset dead websites to allow immediate retry")
+    commands.add_parser("test", help="Test API connections")
+    commands.add_parser("setup", help="Show setup instructions")
+    return parser
 
 
 def main():
     """Main CLI interface for incremental discovery"""
+    args = _build_parser().parse_args()
     system = IncrementalDiscoverySystem()
     
-    if len(sys.argv) > 1:
-        command = sys.argv[1]
-        
-        if command == "start":
-            # Incremental continuous discovery
-            method = sys.argv[2] if len(sys.argv) > 2 else "enhanced_all"
-            interval = int(sys.argv[3]) if len(sys.argv) > 3 else 6
-            auto_score = "--no-scoring" not in sys.argv
-            
-            if method not in system.discovery_methods:
-                print(f"❌ Unknown method: {method}")
-                print(f"Available methods: {list(system.discovery_methods.keys())}")
-                return
-            
-            system.start_continuous(method, interval, auto_score)
-            
-        elif command == "run-once":
-            # Single incremental discovery run
-            method = sys.argv[2] if len(sys.argv) > 2 else "enhanced_all"
-            auto_score = "--no-scoring" not in sys.argv
-            force_full = "--force-full" in sys.argv
-            
-            if method not in system.discovery_methods:
-                print(f"❌ Unknown method: {method}")
-                print(f"Available methods: {list(system.discovery_methods.keys())}")
-                return
-            
-            result = system.run_incremental_discovery(method, auto_score, force_full)
-            print(f"✅ Incremental discovery complete:")
-            print(f"   📈 Found {result['new_tools']} new tools")
-            print(f"   ⚡ Scored {result['scored_tools']} tools") 
-            print(f"   ⏭️ Skipped {result['skipped_tools']} unchanged tools")
-            
-        elif command == "state":
-            # Show current state
-            system.show_state()
-            
-        elif command == "status":
-            # Show comprehensive status
-            system.show_status()
-            
-        elif command == "reset":
-            # Reset state
-            api_name = sys.argv[2] if len(sys.argv) > 2 else None
-            system.reset_state(api_name)
-            
-        elif command == "show-dead":
-            # NEW: Show dead websites and their retry status
-            system.show_dead_websites()
-            
-        elif command == "reset-dead":
-            # NEW: Reset dead websites to allow immediate retry
-            system.reset_dead_websites()
-            
-        elif command == "test":
-            # Test API connections
-            system.test_apis()
-            
-        elif command == "setup":
-            # Show setup instructions
-            print("🛠️ Incremental Discovery Setup:")
-            print("\n⚡ KEY ADVANTAGE: Only checks tools updated since last run!")
-            print("💡 Dramatically reduces API calls and processing time")
-            print("📊 Tracks state in discovery_state.json")
-            print("💀 Smart dead website handling with 3-day cooldowns")
-            
-            print("\n🎯 FIXED ISSUES:")
-            print("✅ Dead websites get proper activity_score=0.0")
-            print("✅ Dead websites aren't retried every run (3-day cooldown)")
-            print("✅ Realistic tool counts (no more 208 when only 104 discovered)")
-            print("✅ Better failure handling and logging")
-            
-            print("\n💾 STATE MANAGEMENT:")
-            print("• Tracks last check time per API")
-            print("• Automatic weekly full scans")
-            print("• Persistent state file (discovery_state.json)")
-            print("• Dead website cooldown tracking")
-            
-            print("\n💀 DEAD WEBSITE COMMANDS:")
-            print("• Show dead sites: python intelligent_discovery.py show-dead")
-            print("• Reset cooldowns: python intelligent_discovery.py reset-dead")
-            
-            print("\n✅ Test your setup:")
-            print("python intelligent_discovery.py state")
-            
-        else:
-            print("❌ Unknown command")
-    else:
-        print("🧠 Incremental AI Tools Discovery System - FIXED VERSION")
-        print("💡 Only processes UPDATED tools since last run!")
-        print("💀 Smart dead website handling with cooldowns!")
-        print("🤖 Includes AI Directory Scraping!")
-        print("\nUsage:")
-        print("  python intelligent_discovery.py start [method] [interval_hours]")
-        print("  python intelligent_discovery.py run-once [method] [--force-full]")
-        print("  python intelligent_discovery.py state")
-        print("  python intelligent_discovery.py status")
-        print("  python intelligent_discovery.py reset [api_name]")
-        print("  python intelligent_discovery.py show-dead")
-        print("  python intelligent_discovery.py reset-dead")
-        print("  python intelligent_discovery.py setup")
-        print("  python intelligent_discovery.py test")
-        
-        print("\n🎯 Discovery Methods:")
-        for method, config in system.discovery_methods.items():
-            print(f"  • {method}: {config['description']}")
-        
-        print("\n⚡ FIXED Features:")
-        print("  • Default: Only check updated tools since last run")
-        print("  • Weekly: Automatic full scan every 7 days")
-        print("  • Force full: Add --force-full flag")
-        print("  • State tracking: Persistent in discovery_state.json")
-        print("  • AI Directories: Daily incremental checks")
-        print("  • Dead sites: 3-day cooldown before retry")
-        print("  • Realistic counts: No more inflated tool numbers")
-        
-        print("\n📋 Examples:")
-        print("  # Incremental discovery with APIs + directories (recommended)")
-        print("  python intelligent_discovery.py run-once enhanced_all")
-        print("")
-        print("  # Check dead websites and their status")
-        print("  python intelligent_discovery.py show-dead")
-        print("")
-        print("  # Force full scan (ignores incremental state)")
-        print("  python intelligent_discovery.py run-once enhanced_all --force-full")
-        print("")
-        print("  # Reset dead website cooldowns (for testing)")
-        print("  python intelligent_discovery.py reset-dead")
-        print("")
-        print("  # Start continuous incremental discovery every 2 hours") 
-        print("  python intelligent_discovery.py start enhanced_all 2")
-        
-        print("\n💡 FIXED Benefits:")
-        print("  🚀 Much faster runs (only checks updated tools)")
-        print("  💰 Reduced API usage (fewer requests)")
-        print("  ⚡ Smart scoring (only re-score when needed)")
-        print("  📊 State persistence (remembers what was checked)")
-        print("  🔄 Auto full-scan weekly (catches any missed updates)")
-        print("  🤖 AI Directory integration (curated quality tools)")
-        print("  💀 Dead website management (3-day cooldowns)")
-        print("  📏 Realistic tool counts (no more fake inflation)")
-
+    if args.command is None:
+        _print_usage(system)
+        return
+    
+    method = getattr(args, "method", None)
+    if method is not None and method not in system.discovery_methods:
+        print(f"❌ Unknown method: {method}")
+        print(f"Available methods: {list(system.method_names)}")
+        return
+    
+    COMMANDS[args.command](system, args)
 
 if __name__ == "__main__":
     main()
\ No newline at end of file
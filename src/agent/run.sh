@@ -9,13 +9,21 @@ if [ ! -z "${AGENT_TLS_CAFILE}" ]; then
   export REQUESTS_CA_BUNDLE=/tmp/ca-certificates.crt
 fi
 
+# Development keeps --reload; set UVICORN_WORKERS to run multiple worker processes instead
+# (uvicorn picks uvloop/httptools automatically when they are installed)
+if [ ! -z "${UVICORN_WORKERS}" ]; then
+  UVICORN_MODE="--workers ${UVICORN_WORKERS}"
+else
+  UVICORN_MODE="--reload"
+fi
+
 if [ "${AGENT_TLS_SERVER_ENABLE}" = "true" ]; then
   echo "Using server cert: ${AGENT_TLS_SERVER_CERT} key: ${AGENT_TLS_SERVER_KEY}"
   # Run migrations first
   alembic upgrade head &&
-  uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload --ssl-certfile ${AGENT_TLS_SERVER_CERT} --ssl-keyfile ${AGENT_TLS_SERVER_KEY}
+  uvicorn app.main:app --host 0.0.0.0 --port 8000 ${UVICORN_MODE} --ssl-certfile ${AGENT_TLS_SERVER_CERT} --ssl-keyfile ${AGENT_TLS_SERVER_KEY}
 else
   # Run migrations first
   alembic upgrade head &&
-  uvicorn app.main:app --host 0.0.0.0 --port 8000 --reload
+  uvicorn app.main:app --host 0.0.0.0 --port 8000 ${UVICORN_MODE}
 fi
\ No newline at end of file
@@ -1,38 +1,110 @@
 import pytest
-from sqlalchemy import create_engine
+from sqlalchemy import create_engine, event
 from sqlalchemy.orm import sessionmaker
+from sqlalchemy.pool import StaticPool
+from passlib.context import CryptContext
 from fastapi.testclient import TestClient
 
+from app.core import security
 from app.core.config import settings
+from app.core.security import create_access_token, get_password_hash
 from app.db.database import Base, get_db
 from app.main import app
+from app.services.agent_service import agent_service
+from app.models.chat import User
 
-# Use an in-memory SQLite database for testing
-TEST_SQLALCHEMY_DATABASE_URL = "sqlite:///./test.db"
+# Use an in-memory SQLite database for testing; StaticPool keeps a single
+# connection so every session (and the TestClient thread) sees the same DB
+TEST_SQLALCHEMY_DATABASE_URL = "sqlite://"
 
 engine = create_engine(
-    TEST_SQLALCHEMY_DATABASE_URL, connect_args={"check_same_thread": False}
+    TEST_SQLALCHEMY_DATABASE_URL,
+    connect_args={"check_same_thread": False},
+    poolclass=StaticPool,
 )
-TestingSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
-@pytest.fixture(scope="function")
-def db():
-    # Create the database
+# Let SAVEPOINTs work on pysqlite: disable its implicit transaction handling
+# and emit BEGIN ourselves
+@event.listens_for(engine, "connect")
+def _disable_pysqlite_transactions(dbapi_connection, connection_record):
+    dbapi_connection.isolation_level = None
+
+@event.listens_for(engine, "begin")
+def _emit_begin(conn):
+    conn.exec_driver_sql("BEGIN")
+
+# Sessions join the per-test outer transaction; commit() only releases a SAVEPOINT
+TestingSessionLocal = sessionmaker(
+    autocommit=False, autoflush=False, join_transaction_mode="create_savepoint"
+)
+
+@pytest.fixture(scope="session", autouse=True)
+def fast_password_hashing():
+    # bcrypt is deliberately slow; tests only need hash/verify to agree
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(security, "pwd_context", CryptContext(schemes=["plaintext"]))
+        yield
+
+@pytest.fixture(scope="session", autouse=True)
+def agent_reply():
+    """Canned assistant reply; /api/v1/chat would otherwise wait on the LLM/MCP agent loop"""
+    reply = "Hello from the test agent"
+    with pytest.MonkeyPatch.context() as mp:
+        mp.setattr(agent_service, "send", lambda message, block=True, timeout=None: reply)
+        mp.setattr(agent_service, "clear", lambda: "clear")
+        yield reply
+
+@pytest.fixture(scope="session")
+def schema():
+    # Create the schema once for the whole run
     Base.metadata.create_all(bind=engine)
+    yield
+    Base.metadata.drop_all(bind=engine)
 
-    # Create a db session
-    db = TestingSessionLocal()
+@pytest.fixture(scope="session")
+def test_user(schema):
+    """Create the test user once; it is committed outside the per-test transactions"""
+    # Attributes stay loaded after commit, so the id needs no refresh SELECT
+    db = TestingSessionLocal(bind=engine, expire_on_commit=False)
+    try:
+        user = User(
+            username="testuser",
+            email="test@example.com",
+            hashed_password=get_password_hash("password123")
+        )
+        db.add(user)
+        db.commit()
+        db.expunge(user)
+        return user
+    finally:
+        db.close()
+
+@pytest.fixture(scope="session")
+def auth_headers(test_user):
+    return {"Authorization": f"Bearer {create_access_token(test_user.id)}"}
+
+@pytest.fixture(scope="function")
+def db(schema):
+    # Run each test inside a transaction that is rolled back afterwards
+    connection = engine.connect()
+    transaction = connection.begin()
+    db = TestingSessionLocal(bind=connection)
     try:
         yield db
     finally:
         db.close()
+        transaction.rollback()
+        connection.close()
 
-    # Drop the database after the test
-    Base.metadata.drop_all(bind=engine)
+@pytest.fixture(scope="session")
+def app_client():
+    # Start the app (and run its lifespan) once for the whole run
+    with TestClient(app) as client:
+        yield client
 
 @pytest.fixture(scope="function")
-def client(db):
-    # Override the get_db dependency
+def client(app_client, db):
+    # Point the get_db dependency at this test's transactional session
     def override_get_db():
         try:
             yield db
@@ -40,8 +112,5 @@ def client(db):
             pass
 
     app.dependency_overrides[get_db] = override_get_db
-
-    with TestClient(app) as client:
-        yield client
-
-    app.dependency_overrides = {}
\ No newline at end of file
+    yield app_client
+    app.dependency_overrides = {}
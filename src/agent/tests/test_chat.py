@@ -1,18 +1,7 @@
 import pytest
-from app.models.chat import User, Conversation, Message
-from app.core.security import get_password_hash
-
-def create_test_user(db):
-    """Create a test user in the database"""
-    user = User(
-        username="testuser",
-        email="test@example.com",
-        hashed_password=get_password_hash("password123")
-    )
-    db.add(user)
-    db.commit()
-    db.refresh(user)
-    return user
+from sqlalchemy import select
+from sqlalchemy.orm import selectinload
+from app.models.chat import Conversation, Message
 
 def test_health_check(client):
     """Test health check endpoint"""
@@ -20,72 +9,53 @@ def test_health_check(client):
     assert response.status_code == 200
     assert response.json() == {"status": "ok"}
 
-def test_chat_api_new_conversation(client, db):
-    """Test chat API with new conversation"""
-    # Create test user
-    user = create_test_user(db)
+@pytest.mark.parametrize("existing_conversation", [False, True])
+def test_chat_api(client, db, test_user, auth_headers, agent_reply, existing_conversation):
+    """Test chat API with a new and with an existing conversation"""
+    payload = {"message": "Hello, how are you?"}
+    previous_messages = 0
+
+    if existing_conversation:
+        # Create a conversation for the user
+        conversation = Conversation(title="Test Conversation", user_id=test_user.id)
+        db.add(conversation)
+        db.flush()  # assigns conversation.id without a separate commit
+        payload["conversation_id"] = conversation.id
+
+        # Add a message to the conversation
+        message = Message(
+            conversation_id=conversation.id,
+            role="user",
+            content="Previous message"
+        )
+        db.add(message)
+        db.commit()
+        previous_messages = 1
 
     # Test chat endpoint
-    response = client.post(
-        "/api/v1/chat",
-        headers={"Authorization": f"Bearer {user}"},
-        json={"message": "Hello, how are you?"}
-    )
+    response = client.post("/api/v1/chat", headers=auth_headers, json=payload)
 
     assert response.status_code == 200
     data = response.json()
 
-    assert "message" in data
+    assert data["message"] == agent_reply
     assert "conversation_id" in data
-    assert data["conversation_id"] > 0
-
-    # Verify conversation and messages were created in DB
-    conversation = db.query(Conversation).filter(Conversation.id == data["conversation_id"]).first()
+    if existing_conversation:
+        assert data["conversation_id"] == payload["conversation_id"]
+    else:
+        assert data["conversation_id"] > 0
+
+    # Verify conversation and messages were created in DB, loading both in one fetch
+    conversation = db.execute(
+        select(Conversation)
+        .options(selectinload(Conversation.messages))
+        .where(Conversation.id == data["conversation_id"])
+    ).scalar_one_or_none()
     assert conversation is not None
 
-    messages = db.query(Message).filter(Message.conversation_id == data["conversation_id"]).all()
-    assert len(messages) == 2  # User message and assistant response
-    assert messages[0].role == "user"
-    assert messages[0].content == "Hello, how are you?"
-    assert messages[1].role == "assistant"
-
-def test_chat_api_existing_conversation(client, db):
-    """Test chat API with existing conversation"""
-    # Create test user
-    user = create_test_user(db)
-
-    # Create a conversation for the user
-    conversation = Conversation(title="Test Conversation", user_id=user.id)
-    db.add(conversation)
-    db.commit()
-    db.refresh(conversation)
-
-    # Add a message to the conversation
-    message = Message(
-        conversation_id=conversation.id,
-        role="user",
-        content="Previous message"
-    )
-    db.add(message)
-    db.commit()
-
-    # Test chat endpoint with existing conversation_id
-    response = client.post(
-        "/api/v1/chat",
-        headers={"Authorization": f"Bearer {user}"},
-        json={
-            "message": "Follow-up question",
-            "conversation_id": conversation.id
-        }
-    )
-
-    assert response.status_code == 200
-    data = response.json()
-
-    assert "message" in data
-    assert "conversation_id" in data
-    assert data["conversation_id"] == conversation.id
-
-    # Verify messages were added to existing conversation
-    messages = db.query(Message).filter(Message.conversation_id == conversation.id).all()
-    assert len(messages) == 3  # Previous + new user message + assistant response
\ No newline at end of file
+    messages = sorted(conversation.messages, key=lambda m: m.id)
+    assert len(messages) == previous_messages + 2  # User message and assistant response
+    assert messages[-2].role == "user"
+    assert messages[-2].content == "Hello, how are you?"
+    assert messages[-1].role == "assistant"
+    assert messages[-1].content == agent_reply
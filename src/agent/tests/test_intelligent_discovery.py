@@ -0,0 +1,160 @@
+import asyncio
+from contextlib import asynccontextmanager
+from datetime import datetime, timedelta
+from types import SimpleNamespace
+
+import pytest
+
+import intelligent_discovery
+from intelligent_discovery import HealthPolicy, IncrementalDiscoverySystem, _probe_key
+from app.models.chat import DiscoveredTool
+from tests.conftest import TestingSessionLocal
+
+
+class FakeActivityService:
+    """Assessor returning a fixed score per website and recording every probe"""
+
+    def __init__(self, scores):
+        self.scores = scores
+        self.calls = []
+
+    async def assess_tool_activity(self, tool):
+        self.calls.append(tool.website)
+        score = self.scores[tool.website]
+        if score is None:
+            return {"activity_score": 0.0, "website_status": 0, "error": "connection refused"}
+        return {"activity_score": score, "website_status": 200}
+
+    @asynccontextmanager
+    async def batch_session(self):
+        yield
+
+
+def test_probe_key_is_per_url():
+    """URLs that only share a host and path prefix must not share a cache entry"""
+    assert _probe_key("https://marketplace.visualstudio.com/items?itemName=a.one") != \
+        _probe_key("https://marketplace.visualstudio.com/items?itemName=b.two")
+    assert _probe_key("https://www.npmjs.com/package/@scope/one") != \
+        _probe_key("https://www.npmjs.com/package/@scope/two")
+    assert _probe_key("https://Example.com/tool/") == _probe_key("https://example.com/tool")
+
+
+def test_probe_cache_does_not_leak_scores_between_tools(monkeypatch, tmp_path):
+    """Each tool keeps its own assessment; only the same URL is served from the cache"""
+    scores = {
+        "https://marketplace.visualstudio.com/items?itemName=a.one": 0.9,
+        "https://marketplace.visualstudio.com/items?itemName=b.two": 0.5,
+    }
+    service = FakeActivityService(scores)
+    monkeypatch.setattr(intelligent_discovery, "unified_activity_service", service, raising=False)
+    system = IncrementalDiscoverySystem(str(tmp_path / "state.json"))
+
+    # One tool per batch, so the second batch sees the first one's cache entry
+    for website, score in scores.items():
+        [(assessment, error)] = asyncio.run(system._assess_batch_async([SimpleNamespace(website=website)]))
+        assert error is None
+        assert assessment["activity_score"] == score
+
+    # A repeat of the same URL is answered from the cache
+    website = next(iter(scores))
+    [(assessment, _)] = asyncio.run(system._assess_batch_async([SimpleNamespace(website=website)]))
+    assert assessment["activity_score"] == scores[website]
+    assert service.calls == list(scores)
+
+
+@pytest.fixture
+def scoring_system(db, monkeypatch, tmp_path):
+    """Discovery system whose scoring sweeps run against the test transaction and a fake assessor"""
+    intelligent_discovery._load_services()
+    service = FakeActivityService({})
+    monkeypatch.setattr(intelligent_discovery, "unified_activity_service", service)
+    monkeypatch.setattr(intelligent_discovery, "SessionLocal", lambda: TestingSessionLocal(bind=db.get_bind()))
+    system = IncrementalDiscoverySystem(str(tmp_path / "state.json"))
+    system.rate_limiter.default_rate = 1000.0
+    return system, service
+
+
+def add_tool(db, website, **columns):
+    """Insert a discovered tool (created now, so incremental sweeps treat it as new)"""
+    tool = DiscoveredTool(name=website, website=website, tool_type="web", created_at=datetime.utcnow(), **columns)
+    db.add(tool)
+    db.commit()
+    return tool
+
+
+def test_back_to_back_sweeps_score_newly_inserted_tools(scoring_system, db):
+    """A discovery run right after the previous sweep still scores the tools it just inserted"""
+    system, service = scoring_system
+    service.scores.update({"https://one.example.com": 0.9, "https://two.example.com": 0.4})
+    
+    first = add_tool(db, "https://one.example.com")
+    assert system._score_tools_needing_update_fixed(False, 10) == 1
+    second = add_tool(db, "https://two.example.com")
+    assert system._score_tools_needing_update_fixed(False, 10) == 1
+    
+    db.expire_all()
+    assert (first.activity_score, second.activity_score) == (0.9, 0.4)
+
+
+def test_health_policy_cooldown_doubles_up_to_the_cap():
+    policy = HealthPolicy()
+    days = [policy.cooldown(failures) / timedelta(days=1) for failures in range(1, 6)]
+    assert days == [1, 2, 4, 7, 7]
+    assert policy.cooldown(0) == timedelta(days=1)
+    assert policy.cooldown(10_000) == timedelta(days=7)
+
+
+def test_failed_probe_extends_the_streak_and_live_probe_resets_it(scoring_system, db):
+    """Dead sites due for a retry back off further on failure and are cleared on success"""
+    system, service = scoring_system
+    service.scores.update({"https://still-down.example.com": None, "https://back-up.example.com": 0.6})
+    checked = datetime.utcnow() - timedelta(days=2)
+    dead = dict(activity_score=0.0, website_status=0, last_activity_check=checked,
+                consecutive_failures=1, cooldown_until=checked + timedelta(days=1))
+    still_down = add_tool(db, "https://still-down.example.com", **dead)
+    back_up = add_tool(db, "https://back-up.example.com", **dead)
+    
+    started = datetime.utcnow()
+    assert system._score_tools_needing_update_fixed(True, 10) == 2
+    
+    db.expire_all()
+    assert still_down.consecutive_failures == 2
+    assert started + timedelta(days=2) <= still_down.cooldown_until <= datetime.utcnow() + timedelta(days=2)
+    assert (back_up.website_status, back_up.consecutive_failures, back_up.cooldown_until) == (200, 0, None)
+
+
+def test_sweep_skips_hosts_that_are_still_cooling_down(scoring_system, db):
+    """A dead site on cooldown is not probed, nor are the other tools on its host"""
+    system, service = scoring_system
+    service.scores.update({"https://down.example.com/new": 0.8, "https://up.example.com": 0.5})
+    checked = datetime.utcnow() - timedelta(hours=1)
+    cooling = add_tool(db, "https://down.example.com/old", activity_score=0.0, website_status=0,
+                       last_activity_check=checked, consecutive_failures=1,
+                       cooldown_until=checked + timedelta(days=1))
+    neighbour = add_tool(db, "https://down.example.com/new")
+    add_tool(db, "https://up.example.com")
+    
+    assert system._score_tools_needing_update_fixed(True, 10) == 1
+    assert service.calls == ["https://up.example.com"]
+    
+    db.expire_all()
+    assert (cooling.consecutive_failures, cooling.last_activity_check) == (1, checked)
+    assert neighbour.activity_score is None
+
+
+def test_failed_state_write_keeps_the_previous_state_file(monkeypatch, tmp_path):
+    state_file = tmp_path / "state.json"
+    system = IncrementalDiscoverySystem(str(state_file))
+    system._save_state()
+    saved = state_file.read_bytes()
+    
+    def partial_dump(obj, f):
+        f.write(b'{"api_last_')
+        raise OSError("disk full")
+    
+    monkeypatch.setattr(intelligent_discovery, "_json_dump", partial_dump)
+    system.state["api_last_checks"]["github"] = 1.0
+    system._save_state()
+    
+    assert state_file.read_bytes() == saved
+    assert [path.name for path in tmp_path.iterdir()] == ["state.json"]